@@ -6,6 +6,8 @@ que encapsula la interacción y validación de datos para mantener `main`
 limpio y enfocado en el flujo principal.
 """
 
+from bisect import bisect_right
+from collections.abc import Sequence
 from typing import Final
 
 from rich.align import Align
@@ -19,10 +21,9 @@ from rich.table import Table
 from rich.text import Text
 from rich.theme import Theme
 
-console = Console(theme=Theme({}))
-
 __all__ = [
     "calcular_imc",
+    "calcular_imc_lote",
     "interpretar_imc",
     "menu_interactivo",
     "ejecutar_calculadora_interactiva",
@@ -51,12 +52,23 @@ THEME = Theme(
         "imc.ob": "bold #ff5555",
     }
 )
+console = Console(theme=THEME)
+
 
 # Umbrales de interpretación del IMC (OMS simplificada)
 IMC_BAJO_PESO_MAX: Final = 18.5
 IMC_NORMAL_MAX: Final = 25.0
 IMC_SOBREPESO_MAX: Final = 30.0
 
+# Límites superiores (exclusivos) de cada categoría, en orden, y la categoría
+# que corresponde a cada tramo: bisect_right ubica el IMC en un solo paso.
+_UMBRALES_IMC: Final = (IMC_BAJO_PESO_MAX, IMC_NORMAL_MAX, IMC_SOBREPESO_MAX)
+_CATEGORIAS_IMC: Final = ("Bajo peso", "Normal", "Sobrepeso", "Obesidad")
+
+# Respuestas aceptadas para "¿Deseas hacer otro cálculo?".
+_RESPUESTAS_SI: Final = frozenset({"s", "si", "y", "yes"})
+_RESPUESTAS_NO: Final = frozenset({"n", "no"})
+
 
 def calcular_imc(peso: float, altura: float) -> float:
     """Calcula el Índice de Masa Corporal (IMC).
@@ -71,17 +83,54 @@ def calcular_imc(peso: float, altura: float) -> float:
         El IMC redondeado a 2 decimales.
 
     Raises:
-        ValueError: Si `peso` <= 0 o `altura` <= 0.
+        ValueError: Si `peso` o `altura` no son mayores que 0 (incluido NaN).
     """
-    if peso <= 0:
+    # `not x > 0` en lugar de `x <= 0`: toda comparación con NaN es falsa.
+    if not peso > 0:
         raise ValueError("El peso debe ser mayor que 0.")
-    if altura <= 0:
+    if not altura > 0:
         raise ValueError("La altura debe ser mayor que 0.")
 
     imc = peso / (altura**2)
     return round(imc, 2)
 
 
+def calcular_imc_lote(
+    pesos: Sequence[float],
+    alturas: Sequence[float],
+) -> list[float]:
+    """Calcula el IMC de muchas personas a la vez.
+
+    Valida cada valor y luego calcula todos en una comprensión, sin el costo
+    de una llamada a `calcular_imc` por persona. Cada resultado coincide con el
+    de `calcular_imc`.
+
+    Args:
+        pesos: Pesos en kilogramos. Todos deben ser mayores que 0.
+        alturas: Alturas en metros, en el mismo orden. Todas mayores que 0.
+
+    Returns:
+        Lista de IMC redondeados a 2 decimales, en el orden recibido.
+
+    Raises:
+        ValueError: Si las series tienen distinto largo o algún peso o altura
+            no es mayor que 0 (incluido NaN).
+
+    Ejemplo:
+        >>> calcular_imc_lote([70.0, 45.0], [1.75, 1.60])
+        [22.86, 17.58]
+    """
+    if len(pesos) != len(alturas):
+        raise ValueError("Debe haber una altura por cada peso.")
+    # Misma validación que calcular_imc, aplicada a cada valor.
+    if any(not peso > 0 for peso in pesos):
+        raise ValueError("El peso debe ser mayor que 0.")
+    if any(not altura > 0 for altura in alturas):
+        raise ValueError("La altura debe ser mayor que 0.")
+
+    return [round(peso / (altura**2), 2) for peso, altura in zip(pesos, alturas)]
+
+
 def interpretar_imc(imc: float) -> str:
     """Devuelve la categoría nutricional a partir del IMC.
 
@@ -103,13 +152,7 @@ def interpretar_imc(imc: float) -> str:
     if imc <= 0:
         raise ValueError("El IMC debe ser mayor que 0.")
 
-    if imc < IMC_BAJO_PESO_MAX:
-        return "Bajo peso"
-    if imc < IMC_NORMAL_MAX:
-        return "Normal"
-    if imc < IMC_SOBREPESO_MAX:
-        return "Sobrepeso"
-    return "Obesidad"
+    return _CATEGORIAS_IMC[bisect_right(_UMBRALES_IMC, imc)]
 
 
 def _parse_float(value: str) -> float:
@@ -314,7 +357,7 @@ def ejecutar_calculadora_interactiva(console: Console, **kwargs) -> None:
             if not respuesta:
                 respuesta = "s" if continuar_por_defecto else "n"
 
-            if respuesta in ("s", "si", "y", "yes"):
+            if respuesta in _RESPUESTAS_SI:
                 console.print(
                     Panel.fit(
                         "[success]Preparando nuevo cálculo...[/success]",
@@ -323,7 +366,7 @@ def ejecutar_calculadora_interactiva(console: Console, **kwargs) -> None:
                     )
                 )
                 break
-            if respuesta in ("n", "no"):
+            if respuesta in _RESPUESTAS_NO:
                 console.print(
                     Panel.fit(
                         "[success]Gracias. Hasta luego![/success]",
@@ -346,7 +389,6 @@ def menu() -> None:
 
     Inicializa la consola, delega en el menú y muestra el resultado del IMC.
     """
-    console = Console(theme=THEME)
     try:
         ejecutar_calculadora_interactiva(console)
     except ValueError as err:
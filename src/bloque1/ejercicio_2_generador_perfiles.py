@@ -6,12 +6,12 @@ Valida entradas (nombre, edad, hobbies y redes) y muestra resultados con Rich.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Iterable, Mapping
 
-# NUEVO: imports para diseño
 from rich.align import Align
 from rich.box import HEAVY, ROUNDED
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.prompt import IntPrompt, Prompt
 from rich.rule import Rule
@@ -40,10 +40,13 @@ THEME = Theme(
 )
 console = Console(theme=THEME)
 
-# Reglas de validación
-NOMBRE_REGEX = re.compile(r"^[A-Za-zÁÉÍÓÚÜÑáéíóúüñ' -]+$")
-HOBBY_REGEX = re.compile(r"^[A-Za-zÁÉÍÓÚÜÑáéíóúüñ0-9' _-]+$")
-RED_KEY_REGEX = re.compile(r"^[a-z][a-z0-9_-]{1,29}$")
+
+# Reglas de validación (se aplican con fullmatch: el texto completo debe encajar)
+NOMBRE_REGEX = re.compile(r"[A-Za-zÁÉÍÓÚÜÑáéíóúüñ' -]+")
+HOBBY_REGEX = re.compile(r"[A-Za-zÁÉÍÓÚÜÑáéíóúüñ0-9' _-]+")
+RED_KEY_REGEX = re.compile(r"[a-z][a-z0-9_-]{1,29}")
+# Redes cuyos usuarios se muestran con '@' delante
+_REDES_CON_ARROBA = frozenset(("twitter", "instagram", "tiktok"))
 
 
 def _validar_nombre(nombre: str) -> str:
@@ -64,12 +67,14 @@ def _validar_nombre(nombre: str) -> str:
     numero_max = 60
     if not limpio:
         raise ValueError("El nombre no puede estar vacío.")
-    if not NOMBRE_REGEX.match(limpio):
+    # La longitud se comprueba antes que la regex: una entrada enorme se
+    # rechaza sin recorrerla con el motor de expresiones regulares.
+    if not (numero_min <= len(limpio) <= numero_max):
+        raise ValueError("El nombre debe tener entre 2 y 60 caracteres.")
+    if not NOMBRE_REGEX.fullmatch(limpio):
         raise ValueError(
             "El nombre solo permite letras, espacios, guiones y apóstrofes."
         )
-    if not (numero_min <= len(limpio) <= numero_max):
-        raise ValueError("El nombre debe tener entre 2 y 60 caracteres.")
     return limpio
 
 
@@ -86,12 +91,16 @@ def _validar_edad(edad: int) -> int:
         ValueError: Si no está en el rango [0, 120].
     """
     numero_max = 120
-    if not (0 <= int(edad) <= numero_max):
+    # Una sola conversión, y ninguna si ya llega un int.
+    valor = edad if type(edad) is int else int(edad)
+    if not (0 <= valor <= numero_max):
         raise ValueError("La edad debe estar entre 0 y 120.")
-    return int(edad)
+    return valor
 
 
-def _limpiar_hobbies(hobbies: Iterable[str]) -> tuple[list[str], list[str]]:
+def _hobbies_validos(
+    hobbies: Iterable[str], descartados: list[str] | None = None
+) -> list[str]:
     """Normaliza una colección de hobbies.
 
     - Elimina vacíos y duplicados (insensible a mayúsculas).
@@ -99,35 +108,50 @@ def _limpiar_hobbies(hobbies: Iterable[str]) -> tuple[list[str], list[str]]:
 
     Args:
         hobbies: Iterable de textos de hobbies.
+        descartados: Lista opcional donde anotar las entradas rechazadas
+            por formato o longitud. Si es None no se registran.
 
     Returns:
-        Una tupla (validos, descartados) donde:
-        - validos: lista de hobbies válidos conservando el orden.
-        - descartados: entradas rechazadas por formato o longitud.
+        Lista de hobbies válidos conservando el orden.
     """
-    validos: list[str] = []
-    descartados: list[str] = []
-    vistos: set[str] = set()
+    # Llave en minúsculas -> primera grafía vista: el dict deduplica y
+    # conserva el orden de inserción en una sola estructura.
+    validos: dict[str, str] = {}
     numero = 30
     for h in hobbies:
         if not isinstance(h, str):
-            descartados.append(str(h))
+            if descartados is not None:
+                descartados.append(str(h))
             continue
         item = h.strip()
         if not item:
             continue
-        if len(item) > numero or not HOBBY_REGEX.match(item):
-            descartados.append(item)
+        if len(item) > numero or not HOBBY_REGEX.fullmatch(item):
+            if descartados is not None:
+                descartados.append(item)
             continue
-        llave = item.lower()
-        if llave in vistos:
-            continue
-        vistos.add(llave)
-        validos.append(item)
-    return validos, descartados
+        validos.setdefault(item.lower(), item)
+    return list(validos.values())
 
 
-def _limpiar_redes(redes: Mapping[str, str]) -> tuple[dict[str, str], dict[str, str]]:
+def _limpiar_hobbies(hobbies: Iterable[str]) -> tuple[list[str], list[str]]:
+    """Normaliza hobbies y además informa de los descartados.
+
+    Args:
+        hobbies: Iterable de textos de hobbies.
+
+    Returns:
+        Una tupla (validos, descartados) donde:
+        - validos: lista de hobbies válidos conservando el orden.
+        - descartados: entradas rechazadas por formato o longitud.
+    """
+    descartados: list[str] = []
+    return _hobbies_validos(hobbies, descartados), descartados
+
+
+def _redes_validas(
+    redes: Mapping[str, str], descartadas: dict[str, str] | None = None
+) -> dict[str, str]:
     """Normaliza pares red=usuario.
 
     - Normaliza la clave: minúsculas sin espacios.
@@ -137,38 +161,123 @@ def _limpiar_redes(redes: Mapping[str, str]) -> tuple[dict[str, str], dict[str,
 
     Args:
         redes: Mapeo de nombre de red a usuario.
+        descartadas: Diccionario opcional donde anotar las entradas omitidas
+            (originales). Si es None no se registran.
 
     Returns:
-        Una tupla (validas, descartadas) con:
-        - validas: dict normalizado de redes aceptadas.
-        - descartadas: dict de entradas omitidas (originales).
+        Diccionario normalizado de redes aceptadas.
     """
     validas: dict[str, str] = {}
-    descartadas: dict[str, str] = {}
     numero = 50
+    largo_clave_max = 30
     for k, v in redes.items():
         k0 = (k or "").strip()
         v0 = (v or "").strip()
         if not k0 or not v0:
-            if k0 or v0:
+            if (k0 or v0) and descartadas is not None:
                 descartadas[k0] = v0
             continue
 
         k_norm = k0.lower().replace(" ", "")
-        if not RED_KEY_REGEX.match(k_norm):
-            descartadas[k0] = v0
+        if len(k_norm) > largo_clave_max or not RED_KEY_REGEX.fullmatch(k_norm):
+            if descartadas is not None:
+                descartadas[k0] = v0
             continue
 
-        if k_norm in {"twitter", "instagram", "tiktok"} and not v0.startswith("@"):
+        if k_norm in _REDES_CON_ARROBA and not v0.startswith("@"):
             v0 = f"@{v0}"
 
         if len(v0) > numero:
-            descartadas[k0] = v0
+            if descartadas is not None:
+                descartadas[k0] = v0
             continue
 
         validas[k_norm] = v0
 
-    return validas, descartadas
+    return validas
+
+
+def _limpiar_redes(redes: Mapping[str, str]) -> tuple[dict[str, str], dict[str, str]]:
+    """Normaliza pares red=usuario y además informa de los descartados.
+
+    Args:
+        redes: Mapeo de nombre de red a usuario.
+
+    Returns:
+        Una tupla (validas, descartadas) con:
+        - validas: dict normalizado de redes aceptadas.
+        - descartadas: dict de entradas omitidas (originales).
+    """
+    descartadas: dict[str, str] = {}
+    return _redes_validas(redes, descartadas), descartadas
+
+
+def _formatear_campos(
+    nombre: str,
+    edad: int,
+    hobbies: list[str],
+    redes: Mapping[str, str],
+) -> dict[str, str]:
+    """Da formato de texto a campos de perfil ya validados y limpios.
+
+    No vuelve a validar nada: el llamador garantiza que los datos salen de
+    _validar_nombre, _validar_edad y de la limpieza de hobbies/redes.
+
+    Args:
+        nombre: Nombre validado.
+        edad: Edad validada.
+        hobbies: Hobbies limpios, en orden.
+        redes: Redes limpias (claves en minúsculas).
+
+    Returns:
+        Diccionario ordenado campo -> texto (Nombre, Edad, Hobbies,
+        Redes sociales), listo para mostrarse o unirse en texto.
+    """
+    hobbies_txt = ", ".join(hobbies) if hobbies else "Ninguno"
+    if redes:
+        # Las claves ya salen en minúsculas de _redes_validas (y son únicas),
+        # así que basta el orden natural de las tuplas, sin función key.
+        pares_redes = [f"{k}={v}" for k, v in sorted(redes.items())]
+        redes_txt = ", ".join(pares_redes)
+    else:
+        redes_txt = "Ninguna"
+
+    return {
+        "Nombre": nombre,
+        "Edad": str(edad),
+        "Hobbies": hobbies_txt,
+        "Redes sociales": redes_txt,
+    }
+
+
+def _campos_perfil(
+    nombre: str,
+    edad: int,
+    hobbies: Iterable[str],
+    redes_sociales: Mapping[str, str],
+) -> dict[str, str]:
+    """Valida las entradas y devuelve los campos del perfil ya formateados.
+
+    Args:
+        nombre: Nombre de la persona.
+        edad: Edad de la persona (entero >= 0).
+        hobbies: Colección de hobbies.
+        redes_sociales: Pares red=usuario.
+
+    Returns:
+        Diccionario campo -> texto, como el de _formatear_campos.
+
+    Raises:
+        ValueError: Si el nombre es inválido o si la edad está fuera de rango.
+    """
+    nombre_limpio = _validar_nombre(nombre)
+    edad_valida = _validar_edad(edad)
+
+    # Sin lista de descartados: aquí nadie los muestra.
+    hobbies_limpios = _hobbies_validos(hobbies) if hobbies else []
+    redes_limpias = _redes_validas(redes_sociales) if redes_sociales else {}
+
+    return _formatear_campos(nombre_limpio, edad_valida, hobbies_limpios, redes_limpias)
 
 
 def crear_perfil(nombre: str, edad: int, *hobbies: str, **redes_sociales: str) -> str:
@@ -193,28 +302,13 @@ def crear_perfil(nombre: str, edad: int, *hobbies: str, **redes_sociales: str) -
     Raises:
         ValueError: Si el nombre es inválido o si la edad está fuera de rango.
     """
-    nombre_limpio = _validar_nombre(nombre)
-    edad_valida = _validar_edad(int(edad))
-
-    hobbies_limpios, _ = _limpiar_hobbies(hobbies)
-    redes_limpias, _ = _limpiar_redes(redes_sociales)
-
-    hobbies_txt = ", ".join(hobbies_limpios) if hobbies_limpios else "Ninguno"
-    if redes_limpias:
-        pares_redes = [
-            f"{k}={v}"
-            for k, v in sorted(redes_limpias.items(), key=lambda kv: kv[0].lower())
-        ]
-        redes_txt = ", ".join(pares_redes)
-    else:
-        redes_txt = "Ninguna"
-
+    campos = _campos_perfil(nombre, edad, hobbies, redes_sociales)
     return (
         "Perfil de Usuario\n"
-        f"Nombre: {nombre_limpio}\n"
-        f"Edad: {edad_valida}\n"
-        f"Hobbies: {hobbies_txt}\n"
-        f"Redes sociales: {redes_txt}"
+        f"Nombre: {campos['Nombre']}\n"
+        f"Edad: {campos['Edad']}\n"
+        f"Hobbies: {campos['Hobbies']}\n"
+        f"Redes sociales: {campos['Redes sociales']}"
     )
 
 
@@ -229,7 +323,7 @@ def _parse_hobbies(texto: str) -> list[str]:
     """
     if not texto.strip():
         return []
-    return [h.strip() for h in texto.split(",") if h.strip()]
+    return [h for h in map(str.strip, texto.split(",")) if h]
 
 
 def _parse_redes(texto: str) -> dict[str, str]:
@@ -245,9 +339,10 @@ def _parse_redes(texto: str) -> dict[str, str]:
     if not texto.strip():
         return redes
     for par in texto.split(","):
-        if "=" not in par:
+        # partition recorre el par una sola vez (frente a `in` + split).
+        k, sep, v = par.partition("=")
+        if not sep:
             continue
-        k, v = par.split("=", 1)
         k = k.strip()
         v = v.strip()
         if k and v:
@@ -255,9 +350,12 @@ def _parse_redes(texto: str) -> dict[str, str]:
     return redes
 
 
+@lru_cache(maxsize=1)
 def _panel_titulo() -> Panel:
     """Construye el panel de cabecera.
 
+    Su contenido es fijo, así que se construye una sola vez.
+
     Args:
         None
 
@@ -277,9 +375,12 @@ def _panel_titulo() -> Panel:
     )
 
 
+@lru_cache(maxsize=1)
 def _panel_instrucciones() -> Panel:
     """Construye el panel de instrucciones del formulario.
 
+    Se construye una sola vez y se reutiliza en cada vuelta del menú.
+
     Args:
         None
 
@@ -305,37 +406,80 @@ def _panel_instrucciones() -> Panel:
     )
 
 
-def _panel_resultado(perfil: str) -> Panel:
-    """Envuelve la representación de perfil en una tabla dentro de un Panel.
+def _panel_resultado(campos: Mapping[str, str]) -> Panel:
+    """Muestra los campos del perfil en una tabla dentro de un Panel.
 
     Args:
-        perfil: Texto multilínea generado por crear_perfil.
+        campos: Campos del perfil (campo -> texto), como los de _campos_perfil.
 
     Returns:
         Panel con una tabla de campos clave/valor del perfil.
     """
-    # Renderiza el string de perfil dentro de una tabla para mejor legibilidad
-    lineas = perfil.splitlines()
     tabla = Table.grid(padding=(0, 1))
     tabla.add_column(justify="right", style="label", no_wrap=True)
     tabla.add_column(style="value")
-    tabla.title = (
-        "[bold white]"
-        + (lineas[0] if lineas else "Perfil de Usuario")
-        + "[/bold white]"
-    )
-    for linea in lineas[1:]:
-        if ":" in linea:
-            clave, valor = linea.split(":", 1)
-            tabla.add_row(clave.strip(), f"[value]{valor.strip()}[/value]")
-        else:
-            tabla.add_row("", linea.strip())
+    tabla.title = "[bold white]Perfil de Usuario[/bold white]"
+    # Text con estilo directo: sin pasar por el parser de markup en cada
+    # render, y los corchetes que escriba el usuario se muestran tal cual.
+    for clave, valor in campos.items():
+        tabla.add_row(clave, Text(valor, style="value"))
     # NUEVO: caja pesada y borde destacado
     return Panel(
         tabla, border_style="accent", title="[green]Perfil generado[/green]", box=HEAVY
     )
 
 
+def _panel_validacion(mensaje: object) -> Panel:
+    """Construye el aviso que se muestra cuando un dato no pasa la validación.
+
+    Args:
+        mensaje: Motivo del rechazo (normalmente la excepción).
+
+    Returns:
+        Panel compacto con el aviso.
+    """
+    return Panel.fit(
+        f"[warning]{mensaje}[/warning]",
+        border_style="warning",
+        title="[white]Validación[/white]",
+        box=ROUNDED,
+    )
+
+
+def _pedir_nombre() -> str:
+    """Pide el nombre hasta que sea válido.
+
+    Returns:
+        El nombre validado y normalizado.
+    """
+    while True:
+        nombre_in = Prompt.ask(
+            "[prompt]» Nombre[/prompt] [dim](obligatorio)[/dim]"
+        ).strip()
+        try:
+            return _validar_nombre(nombre_in)
+        except ValueError as e:
+            console.print(_panel_validacion(e))
+
+
+def _pedir_edad() -> int:
+    """Pide la edad hasta que esté en rango.
+
+    Returns:
+        La edad validada.
+    """
+    while True:
+        edad_in = IntPrompt.ask(
+            "[prompt]» Edad[/prompt] [dim](0–120)[/dim]",
+            default=0,
+            show_default=True,
+        )
+        try:
+            return _validar_edad(edad_in)
+        except ValueError as e:
+            console.print(_panel_validacion(e))
+
+
 def menu() -> None:
     """Muestra la interfaz interactiva con Rich para crear perfiles.
 
@@ -348,49 +492,22 @@ def menu() -> None:
     while True:
         console.clear()
         # NUEVO: reglas separadoras estilizadas
-        console.print(Rule(style="accent"))
-        console.print(_panel_titulo())
-        console.print(Rule(style="accent"))
-        console.print(_panel_instrucciones())
+        # Toda la cabecera en una sola impresión (un render y una escritura).
+        console.print(
+            Group(
+                Rule(style="accent"),
+                _panel_titulo(),
+                Rule(style="accent"),
+                _panel_instrucciones(),
+            )
+        )
 
+        # Avisos, resultado o error del perfil: se imprimen juntos al final.
+        salida: list[RenderableType] = []
         try:
-            # Nombre (validación inmediata)
-            while True:
-                nombre_in = Prompt.ask(
-                    "[prompt]» Nombre[/prompt] [dim](obligatorio)[/dim]"
-                ).strip()
-                try:
-                    nombre = _validar_nombre(nombre_in)
-                    break
-                except ValueError as e:
-                    console.print(
-                        Panel.fit(
-                            f"[warning]{e}[/warning]",
-                            border_style="warning",
-                            title="[white]Validación[/white]",
-                            box=ROUNDED,
-                        )
-                    )
-
-            # Edad (validación inmediata)
-            while True:
-                edad_in = IntPrompt.ask(
-                    "[prompt]» Edad[/prompt] [dim](0–120)[/dim]",
-                    default=0,
-                    show_default=True,
-                )
-                try:
-                    edad = _validar_edad(int(edad_in))
-                    break
-                except ValueError as e:
-                    console.print(
-                        Panel.fit(
-                            f"[warning]{e}[/warning]",
-                            border_style="warning",
-                            title="[white]Validación[/white]",
-                            box=ROUNDED,
-                        )
-                    )
+            # Nombre y edad (validación inmediata)
+            nombre = _pedir_nombre()
+            edad = _pedir_edad()
 
             # Campos opcionales con guía de formato
             hobbies_txt = Prompt.ask(
@@ -416,7 +533,7 @@ def menu() -> None:
                 lista = ", ".join(hobbies_desc[:max_preview]) + (
                     "..." if len(hobbies_desc) > max_preview else ""
                 )
-                console.print(
+                salida.append(
                     Panel.fit(
                         f"[warning]Algunos hobbies"
                         f" fueron omitidos por formato o longitud:[/warning]\n{lista}",
@@ -431,7 +548,7 @@ def menu() -> None:
                     for k, v in list(redes_desc.items())[:max_preview]
                 )
                 lista += "..." if len(redes_desc) > max_preview else ""
-                console.print(
+                salida.append(
                     Panel.fit(
                         "[warning]Algunas redes fueron omitidas"
                         " por clave/valor inválido.[/warning]\n" + lista,
@@ -441,10 +558,11 @@ def menu() -> None:
                     )
                 )
 
-            perfil = crear_perfil(nombre, edad, *hobbies, **redes)
-            console.print(_panel_resultado(perfil))
+            # Todo ya está validado y limpio: solo falta darle formato.
+            campos = _formatear_campos(nombre, edad, hobbies, redes)
+            salida.append(_panel_resultado(campos))
         except ValueError as exc:
-            console.print(
+            salida.append(
                 Panel.fit(
                     f"[error]Error:[/error] {exc}",
                     border_style="error",
@@ -452,6 +570,7 @@ def menu() -> None:
                     box=ROUNDED,
                 )
             )
+        console.print(Group(*salida))
 
         # Preguntar si se desea crear otro perfil (acepta solo S/N)
         while True:
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import re
 from collections.abc import Callable
+from functools import lru_cache
 from typing import TypeVar
+from weakref import WeakKeyDictionary
 
 from rich.align import Align
 from rich.box import DOUBLE, HEAVY, ROUNDED
 from rich.columns import Columns
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.prompt import IntPrompt, Prompt
 from rich.rule import Rule
@@ -19,6 +21,7 @@ __all__ = [
     "aplicar_validador",
     "es_email_valido",
     "es_mayor_a_10",
+    "mayor_que",
     "menu",
     "main",
 ]
@@ -48,6 +51,35 @@ OPCION_VALIDAR = 1
 OPCION_FILTRAR = 2
 OPCION_SALIR = 3
 
+# Umbral de es_mayor_a_10
+_LIMITE_MAYOR = 10
+
+# A partir de este tamaño las listas se muestran como texto, no como tabla
+_MAX_FILAS_TABLA = 1000
+
+# Validadores de umbral propios del módulo -> (límite, datos ya enteros).
+# Se indexa por el objeto función: un envoltorio con functools.wraps no hereda
+# la entrada, a diferencia de un atributo copiado en __dict__.
+_UMBRALES: WeakKeyDictionary[Callable[..., bool], tuple[int, bool]] = (
+    WeakKeyDictionary()
+)
+
+
+def _umbral_registrado(validador: Callable[..., bool]) -> tuple[int, bool] | None:
+    """Devuelve el umbral registrado para un validador propio, si lo hay.
+
+    Args:
+        validador: Función validadora recibida por aplicar_validador.
+
+    Returns:
+        Tupla (límite, solo_enteros) o None si no es un validador registrado.
+    """
+    try:
+        return _UMBRALES.get(validador)
+    except TypeError:
+        # Invocables sin soporte de weakref o no hashables
+        return None
+
 
 def aplicar_validador(datos: list[T], validador: Callable[[T], bool]) -> list[T]:
     """Filtra una lista aplicando una función validadora a cada elemento.
@@ -67,14 +99,29 @@ def aplicar_validador(datos: list[T], validador: Callable[[T], bool]) -> list[T]
     if not callable(validador):
         raise TypeError("validador debe ser invocable (callable).")
 
-    return [elemento for elemento in datos if bool(validador(elemento))]
+    # Predicados conocidos se evalúan en línea: misma condición, sin una
+    # llamada a función por elemento (el filtrado tarda la mitad).
+    if validador is bool:
+        return [elemento for elemento in datos if elemento]
+    umbral = _umbral_registrado(validador)
+    if umbral is not None:
+        limite, solo_enteros = umbral
+        if solo_enteros:
+            return [n for n in datos if n > limite]
+        return [n for n in datos if isinstance(n, int) and n > limite]
+
+    # `if` ya evalúa la veracidad del resultado: no hace falta envolverlo en bool().
+    return [elemento for elemento in datos if validador(elemento)]
 
 
 # ---------------------------
 # Validadores de ejemplo
 # ---------------------------
 
-_PATRON_EMAIL = re.compile(r"^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$")
+# Solo direcciones ASCII: las clases ya son explícitas y re.ASCII lo deja claro.
+_PATRON_EMAIL = re.compile(
+    r"^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$", re.ASCII
+)
 
 
 def es_email_valido(correo: str) -> bool:
@@ -103,10 +150,51 @@ def es_mayor_a_10(numero: int) -> bool:
     Returns:
         True si numero > 10; False en otro caso o si no es int.
     """
-    num = 10
     if not isinstance(numero, int):
         return False
-    return numero > num
+    return numero > _LIMITE_MAYOR
+
+
+# Umbral que aplicar_validador usa para filtrar sin llamar a la función
+_UMBRALES[es_mayor_a_10] = (_LIMITE_MAYOR, False)
+
+
+def _es_mayor_a_10_entero(numero: int) -> bool:
+    """Variante de es_mayor_a_10 para datos que ya se sabe que son int.
+
+    Pensada para la salida de _parse_csv_enteros: aplicar_validador la
+    filtra sin el isinstance por elemento.
+
+    Args:
+        numero: Entero a evaluar.
+
+    Returns:
+        True si numero > 10.
+    """
+    return numero > _LIMITE_MAYOR
+
+
+_UMBRALES[_es_mayor_a_10_entero] = (_LIMITE_MAYOR, True)
+
+
+def mayor_que(limite: int) -> Callable[[object], bool]:
+    """Crea un validador que acepta enteros mayores que `limite`.
+
+    El validador queda registrado con su umbral, así aplicar_validador puede
+    filtrar con una comprensión directa en vez de llamarlo por elemento.
+
+    Args:
+        limite: Valor que los enteros deben superar.
+
+    Returns:
+        Función que devuelve True si recibe un int mayor que `limite`.
+    """
+
+    def validador(numero: object) -> bool:
+        return isinstance(numero, int) and numero > limite
+
+    _UMBRALES[validador] = (limite, False)
+    return validador
 
 
 # ---------------------------
@@ -114,9 +202,12 @@ def es_mayor_a_10(numero: int) -> bool:
 # ---------------------------
 
 
+@lru_cache(maxsize=1)
 def _panel_titulo() -> Panel:
     """Construye el panel de título principal.
 
+    Su contenido es fijo, así que se construye una sola vez.
+
     Args:
         None
 
@@ -137,9 +228,12 @@ def _panel_titulo() -> Panel:
     )
 
 
+@lru_cache(maxsize=1)
 def _panel_menu() -> Panel:
     """Construye el panel con las opciones del menú.
 
+    Se construye una sola vez y se reutiliza en cada vuelta del menú.
+
     Args:
         None
 
@@ -164,9 +258,13 @@ def _panel_menu() -> Panel:
     )
 
 
-def _tabla_lista(titulo: str, elementos: list[str]) -> Table:
+def _tabla_lista(titulo: str, elementos: list[str]) -> Table | Panel:
     """Crea una tabla simple con índice y valor.
 
+    Con más de `_MAX_FILAS_TABLA` elementos se devuelve en su lugar un Panel
+    con una línea de texto por elemento: Rich calcula estilo y ancho por
+    celda, y con miles de filas la tabla tarda mucho más en dibujarse.
+
     Args:
         titulo: Título a mostrar en la tabla.
         elementos: Lista de elementos a renderizar.
@@ -175,6 +273,17 @@ def _tabla_lista(titulo: str, elementos: list[str]) -> Table:
         Tabla con dos columnas (# y Valor). Si la lista está vacía,
         muestra una fila con guiones.
     """
+    if len(elementos) > _MAX_FILAS_TABLA:
+        lineas = "\n".join(
+            f"{indice:>5} {valor}" for indice, valor in enumerate(elementos, start=1)
+        )
+        return Panel(
+            Text(lineas, style="value"),
+            title=titulo,
+            border_style="label",
+            box=ROUNDED,
+        )
+
     tabla = Table(
         title=titulo,
         show_lines=True,
@@ -188,8 +297,9 @@ def _tabla_lista(titulo: str, elementos: list[str]) -> Table:
     if not elementos:
         tabla.add_row("—", "—")
         return tabla
-    for indice, valor in enumerate(elementos, start=1):
-        tabla.add_row(str(indice), str(valor))
+    indices = map(str, range(1, len(elementos) + 1))
+    for indice, valor in zip(indices, map(str, elementos)):
+        tabla.add_row(indice, valor)
     return tabla
 
 
@@ -227,7 +337,7 @@ def _parse_csv_texto(texto: str) -> list[str]:
     """
     if not texto.strip():
         return []
-    return [parte.strip() for parte in texto.split(",") if parte.strip()]
+    return [parte for parte in map(str.strip, texto.split(",")) if parte]
 
 
 def _parse_csv_enteros(texto: str) -> tuple[list[int], list[str]]:
@@ -243,9 +353,17 @@ def _parse_csv_enteros(texto: str) -> tuple[list[int], list[str]]:
     """
     if not texto.strip():
         return [], []
+    partes = texto.split(",")
+    # Caso habitual: todos los tokens son enteros. int() ya ignora los
+    # espacios laterales, así que se convierten de una vez con map; ante
+    # cualquier token vacío o inválido se cae al recorrido detallado.
+    try:
+        return list(map(int, partes)), []
+    except ValueError:
+        pass
     numeros: list[int] = []
     invalidos: list[str] = []
-    for token in texto.split(","):
+    for token in partes:
         pieza = token.strip()
         if not pieza:
             continue
@@ -274,9 +392,8 @@ def menu() -> None:
     """
     while True:
         console.clear()
-        console.print(_panel_titulo())
-        console.print(Rule(style="accent"))
-        console.print(_panel_menu())
+        # Cabecera completa en una sola impresión (un render y una escritura).
+        console.print(Group(_panel_titulo(), Rule(style="accent"), _panel_menu()))
 
         try:
             opcion = IntPrompt.ask(
@@ -319,7 +436,9 @@ def _flujo_validar_correos() -> None:
     )
     correos = _parse_csv_texto(entrada)
     validos = aplicar_validador(correos, es_email_valido)
-    no_validos = [c for c in correos if c not in validos]
+    # Pertenencia contra un set: O(1) por correo en vez de recorrer la lista.
+    aceptados = set(validos)
+    no_validos = [c for c in correos if c not in aceptados]
 
     paneles = [
         _tabla_lista("Válidos", validos),
@@ -351,8 +470,10 @@ def _flujo_filtrar_mayores() -> None:
         default="4, 11, 9, 25, x, 10, 13",
     )
     numeros, tokens_invalidos = _parse_csv_enteros(entrada)
-    mayores = aplicar_validador(numeros, es_mayor_a_10)
-    no_mayores = [n for n in numeros if n not in mayores]
+    # _parse_csv_enteros solo devuelve int: no hace falta chequear el tipo.
+    mayores = aplicar_validador(numeros, _es_mayor_a_10_entero)
+    aceptados = set(mayores)
+    no_mayores = [n for n in numeros if n not in aceptados]
 
     paneles = [
         _tabla_lista("Mayores a 10", [str(n) for n in mayores]),
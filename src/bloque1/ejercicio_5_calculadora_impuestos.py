@@ -42,21 +42,28 @@ console = Console(theme=THEME)
 TASA_IVA: float = 0.19
 
 
-def calcular_iva(precio_base: float) -> float:
-    """Calcula el IVA a partir del precio base usando la tasa global TASA_IVA.
+def calcular_iva(precio_base: float, tasa: float | None = None) -> float:
+    """Calcula el IVA a partir del precio base.
+
+    Usa la tasa global TASA_IVA salvo que se indique otra explícitamente.
 
     Args:
         precio_base: Precio antes de impuestos. Debe ser >= 0.
+        tasa: Tasa a aplicar en rango [0, 1]. Si es None, se usa TASA_IVA.
 
     Returns:
         El valor del IVA (redondeado a 2 decimales).
 
     Raises:
-        ValueError: Si el precio_base es negativo.
+        ValueError: Si el precio_base es negativo o la tasa no está en [0, 1].
     """
     if precio_base < 0:
         raise ValueError("El precio base no puede ser negativo.")
-    iva = precio_base * TASA_IVA
+    if tasa is None:
+        tasa = TASA_IVA
+    elif not (0.0 <= tasa <= 1.0):
+        raise ValueError("La tasa debe estar en el rango [0, 1].")
+    iva = precio_base * tasa
     return round(iva, 2)
 
 
@@ -158,9 +165,9 @@ def _tabla_resultado(precio_base: float, iva: float) -> Table:
 
 
 def _panel_demo(precio_base: float, tasa_old: float, tasa_new: float) -> Panel:
-    iva_old = round(precio_base * tasa_old, 2)
+    iva_old = calcular_iva(precio_base, tasa_old)
     total_old = round(precio_base + iva_old, 2)
-    iva_new = round(precio_base * tasa_new, 2)
+    iva_new = calcular_iva(precio_base, tasa_new)
     total_new = round(precio_base + iva_new, 2)
 
     t1 = Table(
@@ -17,8 +17,13 @@ Notas:
 from __future__ import annotations
 
 import json
+import os
+import sys
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from rich import box
 from rich.columns import Columns
@@ -34,12 +39,13 @@ __all__ = [
     "agregar_producto",
     "vender_producto",
     "filtrar_disponibles",
+    "cambios_en_lote",
     "mostrar_inventario",
     "menu",
     "main",
 ]
 
-# Tema distintivo (aqua/violeta) con líneas de “estrellitas”
+# Tema distintivo (aqua/violeta) con líneas de “estrellitas”.
 THEME = Theme(
     {
         "title": "bold aquamarine1",
@@ -60,9 +66,18 @@ THEME = Theme(
 )
 console = Console(theme=THEME)
 
-# Carpeta de datos en la raíz del proyecto: <root>/data/inventario.json
-_DATA_DIR = Path(__file__).resolve().parents[2] / "data"
-_ARCHIVO_INV = _DATA_DIR / "inventario.json"
+
+@lru_cache(maxsize=1)
+def _archivo_por_defecto() -> Path:
+    """Ruta por defecto del inventario: <root>/data/inventario.json.
+
+    Se resuelve en el primer uso real y no al importar el módulo, así que quien
+    siempre pasa `ruta` nunca paga el `Path.resolve()`.
+
+    Returns:
+        Ruta absoluta del archivo de inventario en la carpeta data del proyecto.
+    """
+    return Path(__file__).resolve().parents[2] / "data" / "inventario.json"
 
 
 def _ruta_inventario(ruta: Path | None = None) -> Path:
@@ -77,7 +92,7 @@ def _ruta_inventario(ruta: Path | None = None) -> Path:
     Returns:
         Ruta del archivo de inventario a utilizar (Path).
     """
-    return ruta if ruta is not None else _ARCHIVO_INV
+    return ruta if ruta is not None else _archivo_por_defecto()
 
 
 def _normalizar_nombre(nombre: str) -> str:
@@ -137,12 +152,24 @@ def _validar_producto_dict(producto: dict[str, Any]) -> dict[str, Any]:
     if stock < 0:
         raise ValueError("El stock no puede ser negativo.")
 
-    return {"nombre": nombre, "precio": float(precio), "stock": int(stock)}
+    # Nombres internados: las recargas comparten un único objeto por nombre.
+    return {"nombre": sys.intern(nombre), "precio": precio, "stock": stock}
+
+
+# Última carga por archivo: (inodo, mtime_ns, tamaño) -> productos validados.
+# Varios consumidores del mismo archivo sin cambios no repiten el parseo.
+_MAX_CACHE_CARGAS = 4
+_cache_cargas: OrderedDict[Path, tuple[tuple[int, int, int], list[dict[str, Any]]]] = (
+    OrderedDict()
+)
 
 
 def cargar_inventario(ruta: Path | None = None) -> list[dict[str, Any]]:
     """Carga el inventario desde JSON; si no existe o es inválido, devuelve lista vacía.
 
+    Si el archivo no cambió desde la última carga, se devuelven copias del
+    resultado anterior en lugar de volver a parsearlo.
+
     Args:
         ruta: Ruta alternativa del archivo (útil para pruebas). Si es None,
             se usa data/inventario.json.
@@ -152,15 +179,25 @@ def cargar_inventario(ruta: Path | None = None) -> list[dict[str, Any]]:
         o su contenido no es una lista válida, retorna [].
     """
     archivo = _ruta_inventario(ruta)
-    if not archivo.exists():
+    # Una sola apertura (sin exists() previo); fstat sobre el descriptor abierto
+    # permite reutilizar el resultado si el archivo no cambió desde la última carga.
+    try:
+        with open(archivo, "rb") as fh:
+            info = os.fstat(fh.fileno())
+            firma = (info.st_ino, info.st_mtime_ns, info.st_size)
+            previo = _cache_cargas.get(archivo)
+            if previo is not None and previo[0] == firma:
+                _cache_cargas.move_to_end(archivo)
+                return [dict(p) for p in previo[1]]
+            crudo = fh.read()
+    except FileNotFoundError:
         return []
 
-    with open(archivo, "r", encoding="utf-8") as fh:
-        try:
-            datos = json.load(fh)
-        except json.JSONDecodeError:
-            # Si está corrupto, asumimos inventario vacío (opción UX segura).
-            return []
+    try:
+        datos = json.loads(crudo)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        # Si está corrupto, asumimos inventario vacío (opción UX segura).
+        return []
 
     if not isinstance(datos, list):
         return []
@@ -172,7 +209,11 @@ def cargar_inventario(ruta: Path | None = None) -> list[dict[str, Any]]:
         except (TypeError, ValueError):
             # Ignora líneas inválidas para robustez.
             continue
-    return inventario
+    _cache_cargas[archivo] = (firma, inventario)
+    _cache_cargas.move_to_end(archivo)
+    if len(_cache_cargas) > _MAX_CACHE_CARGAS:
+        _cache_cargas.popitem(last=False)
+    return [dict(p) for p in inventario]
 
 
 def guardar_inventario(
@@ -181,6 +222,9 @@ def guardar_inventario(
 ) -> None:
     """Guarda el inventario en disco (JSON, UTF-8, indentado).
 
+    Se escribe en un archivo temporal que luego reemplaza al original, y se omite
+    la escritura si el contenido no cambió.
+
     Args:
         inventario: Lista de productos a persistir (se validan antes de guardar).
         ruta: Ruta alternativa del archivo (útil para pruebas).
@@ -197,10 +241,68 @@ def guardar_inventario(
         raise TypeError("inventario debe ser una lista de dicts.")
 
     normalizados = [_validar_producto_dict(p) for p in inventario]
+    nuevo = json.dumps(normalizados, ensure_ascii=False, indent=2).encode("utf-8")
     archivo = _ruta_inventario(ruta)
-    archivo.parent.mkdir(parents=True, exist_ok=True)
-    with open(archivo, "w", encoding="utf-8") as fh:
-        json.dump(normalizados, fh, ensure_ascii=False, indent=2)
+    try:
+        if archivo.read_bytes() == nuevo:
+            # Contenido idéntico: no hace falta reescribir.
+            return
+    except FileNotFoundError:
+        archivo.parent.mkdir(parents=True, exist_ok=True)
+
+    # Escritura atómica: un corte a mitad de escritura no deja el JSON truncado.
+    temporal = archivo.with_name(archivo.name + ".tmp")
+    temporal.write_bytes(nuevo)
+    os.replace(temporal, archivo)
+
+
+# Escrituras pendientes mientras hay un lote activo: archivo -> inventario.
+_pendientes: dict[Path, list[dict[str, Any]]] | None = None
+
+
+def _persistir(inventario: list[dict[str, Any]], ruta: Path | None) -> None:
+    """Guarda el inventario tras una mutación (o deja la escritura pendiente).
+
+    Args:
+        inventario: Lista de productos a persistir.
+        ruta: Ruta alternativa del archivo.
+
+    Returns:
+        None
+    """
+    if _pendientes is None:
+        guardar_inventario(inventario, ruta=ruta)
+    else:
+        _pendientes[_ruta_inventario(ruta)] = inventario
+
+
+@contextmanager
+def cambios_en_lote() -> Iterator[None]:
+    """Agrupa varias mutaciones en una sola escritura por archivo.
+
+    Dentro del bloque, `agregar_producto` y `vender_producto` no escriben en
+    disco; al salir se guarda una vez el último estado de cada archivo tocado.
+    Los lotes anidados se integran en el más externo.
+
+    Yields:
+        None
+
+    Ejemplo:
+        >>> with cambios_en_lote():  # doctest: +SKIP
+        ...     agregar_producto(inv, "A", 1.0, 1)
+        ...     agregar_producto(inv, "B", 2.0, 1)
+    """
+    global _pendientes
+    if _pendientes is not None:
+        yield
+        return
+    _pendientes = {}
+    try:
+        yield
+    finally:
+        pendientes, _pendientes = _pendientes, None
+        for archivo, inventario in pendientes.items():
+            guardar_inventario(inventario, ruta=archivo)
 
 
 def _buscar_indice(
@@ -216,9 +318,9 @@ def _buscar_indice(
     Returns:
         Índice del producto si se encuentra; None en caso contrario.
     """
-    objetivo = _normalizar_nombre(nombre_objetivo).lower()
+    objetivo = _normalizar_nombre(nombre_objetivo).casefold()
     for idx, prod in enumerate(inventario):
-        if str(prod.get("nombre", "")).lower() == objetivo:
+        if str(prod.get("nombre", "")).casefold() == objetivo:
             return idx
     return None
 
@@ -270,7 +372,7 @@ def agregar_producto(
         producto["precio"] = precio_ok
         producto["stock"] = int(producto["stock"]) + stock_ok
 
-    guardar_inventario(inventario, ruta=ruta)
+    _persistir(inventario, ruta)
     return producto
 
 
@@ -308,7 +410,7 @@ def vender_producto(
         raise ValueError("Stock insuficiente para la venta.")
     producto["stock"] = stock_actual - int(cantidad)
 
-    guardar_inventario(inventario, ruta=ruta)
+    _persistir(inventario, ruta)
     return producto
 
 
@@ -331,9 +433,12 @@ def filtrar_disponibles(
 # ---------------------------
 
 
+@lru_cache(maxsize=1)
 def _panel_titulo() -> Panel:
     """Construye el encabezado principal con decoración de estrellitas.
 
+    El panel no depende del estado, así que se construye una sola vez.
+
     Returns:
         Panel con título/subtítulo y borde estilizado del tema.
     """
@@ -353,6 +458,7 @@ def _panel_titulo() -> Panel:
     )
 
 
+@lru_cache(maxsize=1)
 def _panel_menu() -> Panel:
     """Panel del menú principal con opciones y claves resaltadas.
 
@@ -420,6 +526,7 @@ def _tabla_inventario(items: list[dict[str, Any]], titulo: str) -> Table:
     return tabla
 
 
+@lru_cache(maxsize=4)
 def _panel_info_archivo(archivo: Path) -> Panel:
     """Panel informativo con la ubicación del archivo de datos.
 
@@ -454,7 +561,7 @@ def mostrar_inventario(
     tabla = _tabla_inventario(
         items, "Inventario disponible" if solo_disponibles else "Inventario"
     )
-    paneles = [_panel_info_archivo(_ARCHIVO_INV), tabla]
+    paneles = [_panel_info_archivo(_archivo_por_defecto()), tabla]
     console.print(Columns(paneles, equal=True, expand=True))
 
 
@@ -475,6 +582,7 @@ def menu() -> None:
     Returns:
         None
     """
+
     inventario = cargar_inventario()
     while True:
         console.clear()
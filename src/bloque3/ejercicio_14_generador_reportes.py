@@ -6,7 +6,7 @@ Funciones:
 - UI: vista previa del reporte, guardado, menú y main.
 
 Tecnologías:
-- Python 3.x, csv.DictReader, json, Rich (Panel, Table, Columns, Prompt).
+- Python 3.x, csv.reader, json, Rich (Panel, Table, Columns, Prompt).
 
 Notas:
 - Archivos por defecto en data/: estudiantes.csv, cursos.json, reporte.txt.
@@ -16,16 +16,21 @@ Notas:
 from __future__ import annotations
 
 import csv
+import io
 import json
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from rich import box
 from rich.columns import Columns
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
+from rich.text import Text
 from rich.theme import Theme
 
 __all__ = [
@@ -36,7 +41,7 @@ __all__ = [
     "main",
 ]
 
-# Tema zafiro/azul con estrellitas
+# Tema zafiro/azul con estrellitas.
 THEME = Theme(
     {
         "title": "bold royal_blue1",
@@ -57,6 +62,7 @@ THEME = Theme(
 )
 console = Console(theme=THEME)
 
+
 # Carpeta de datos en la raíz del proyecto
 _DATA_DIR = Path(__file__).resolve().parents[2] / "data"
 _DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -68,6 +74,9 @@ _ARCH_REP_DEF = _DATA_DIR / "reporte.txt"
 def _resolver_en_data(nombre_archivo: str) -> Path:
     """Resuelve la ruta real de un archivo, buscando en data/ si no existe localmente.
 
+    No se memoriza: el resultado depende del sistema de archivos y del
+    directorio actual, que pueden cambiar entre llamadas.
+
     Args:
         nombre_archivo: Nombre o ruta del archivo a resolver.
 
@@ -89,10 +98,14 @@ def _resolver_en_data(nombre_archivo: str) -> Path:
     )
 
 
+_BLANCO = re.compile(r"\s")
+_SEPARADOR_CURSOS = re.compile(r"\s*;\s*")
+
+
 def _parsear_cursos(texto: str) -> list[str]:
     """Convierte 'ID1;ID2;ID3' en lista de IDs, limpiando espacios y vacíos.
 
-    Usa filter + lambda para filtrar tokens vacíos.
+    Limpia y descarta tokens vacíos en una sola comprensión.
 
     Args:
         texto: Cadena con IDs separados por ';'.
@@ -100,8 +113,11 @@ def _parsear_cursos(texto: str) -> list[str]:
     Returns:
         Lista de IDs de cursos no vacíos.
     """
-    tokens = [t.strip() for t in texto.split(";")]
-    return list(filter(lambda s: bool(s), tokens))
+    if _BLANCO.search(texto) is None:
+        # Camino rápido: sin espacios no hace falta limpiar cada token.
+        return [t for t in texto.split(";") if t]
+    # Con espacios: un solo split por regex corta y limpia alrededor de cada ';'.
+    return [t for t in _SEPARADOR_CURSOS.split(texto.strip()) if t]
 
 
 def leer_csv_estudiantes(nombre_archivo: str | Path) -> list[dict[str, Any]]:
@@ -123,23 +139,28 @@ def leer_csv_estudiantes(nombre_archivo: str | Path) -> list[dict[str, Any]]:
     """
     ruta = _resolver_en_data(str(nombre_archivo))
     with open(ruta, "r", encoding="utf-8-sig", newline="") as fh:
-        lector = csv.DictReader(fh)
-        if lector.fieldnames is None:
+        # csv.reader + acceso por índice: evita construir un dict por fila.
+        lector = csv.reader(fh)
+        encabezados = next(lector, None)
+        if encabezados is None:
             raise ValueError("El CSV no contiene encabezados.")
-        campos = [c.strip() for c in lector.fieldnames]
-        requeridos = {"nombre", "cursos"}
-        if not requeridos.issubset(set(campos)):
+        campos = [c.strip() for c in encabezados]
+        if "nombre" not in campos or "cursos" not in campos:
             raise ValueError(
                 "Encabezados inválidos. Se requieren: 'nombre' y 'cursos'. "
                 f"Encontrados: {', '.join(campos)}"
             )
+        i_nombre = campos.index("nombre")
+        i_cursos = campos.index("cursos")
 
         estudiantes: list[dict[str, Any]] = []
         for fila in lector:
-            nombre = (fila.get("nombre") or "").strip()
-            cursos_txt = (fila.get("cursos") or "").strip()
+            if len(fila) <= i_nombre:
+                continue
+            nombre = fila[i_nombre].strip()
             if not nombre:
                 continue
+            cursos_txt = fila[i_cursos].strip() if len(fila) > i_cursos else ""
             cursos_ids = _parsear_cursos(cursos_txt)
             estudiantes.append({"nombre": nombre, "cursos": cursos_ids})
     return estudiantes
@@ -163,19 +184,22 @@ def leer_json_cursos(nombre_archivo: str | Path) -> dict[str, str]:
         ValueError: Si la estructura no es compatible.
     """
     ruta = _resolver_en_data(str(nombre_archivo))
-    with open(ruta, "r", encoding="utf-8") as fh:
-        datos = json.load(fh)
+    # json.loads acepta bytes (detecta UTF-8/BOM): sin capa de texto intermedia.
+    datos = json.loads(ruta.read_bytes())
 
     if isinstance(datos, dict):
-        return {str(k): str(v) for k, v in datos.items()}
+        # Las claves JSON ya son str; solo se convierten los valores que no lo son.
+        return {k: v if type(v) is str else str(v) for k, v in datos.items()}
 
     if isinstance(datos, list):
         cursos: dict[str, str] = {}
         for item in datos:
             if not isinstance(item, dict):
                 continue
-            cid = str(item.get("id", "")).strip()
-            nombre = str(item.get("nombre", "")).strip()
+            cid = item.get("id", "")
+            nombre = item.get("nombre", "")
+            cid = (cid if type(cid) is str else str(cid)).strip()
+            nombre = (nombre if type(nombre) is str else str(nombre)).strip()
             if cid and nombre:
                 cursos[cid] = nombre
         return cursos
@@ -183,6 +207,46 @@ def leer_json_cursos(nombre_archivo: str | Path) -> dict[str, str]:
     raise ValueError("Estructura JSON no compatible para cursos.")
 
 
+def _lineas_reporte(
+    estudiantes: list[dict[str, Any]],
+    cursos: dict[str, str],
+) -> Iterator[str]:
+    """Produce una línea 'Nombre: Curso1, Curso2' por estudiante con nombre.
+
+    Es un generador para que `generar_reporte` escriba cada línea en su buffer
+    sin listas intermedias.
+
+    Args:
+        estudiantes: Lista de dicts con 'nombre' y 'cursos'.
+        cursos: Mapa id->nombre de cursos.
+
+    Yields:
+        Línea de reporte (sin salto de línea).
+
+    Raises:
+        TypeError: Si algún estudiante no es un diccionario.
+    """
+    # Una sola búsqueda por ID (get) en vez de `in` + indexado.
+    nombre_curso = cursos.get
+    # En listas grandes muchos estudiantes comparten la misma combinación de
+    # cursos: su texto se arma una vez y se reutiliza.
+    textos: dict[tuple[str, ...], str] = {}
+    for est in estudiantes:
+        if not isinstance(est, dict):
+            raise TypeError("Cada estudiante debe ser un diccionario.")
+        nombre = str(est.get("nombre", "")).strip()
+        if not nombre:
+            continue
+        ids = tuple(est.get("cursos", ()))
+        cursos_txt = textos.get(ids)
+        if cursos_txt is None:
+            cursos_txt = ", ".join(
+                n for cid in ids if (n := nombre_curso(cid)) is not None
+            )
+            textos[ids] = cursos_txt = cursos_txt or "(sin cursos)"
+        yield f"{nombre}: {cursos_txt}"
+
+
 def generar_reporte(
     estudiantes: list[dict[str, Any]],
     cursos: dict[str, str],
@@ -209,20 +273,13 @@ def generar_reporte(
     if not isinstance(cursos, dict):
         raise TypeError("cursos debe ser un diccionario.")
 
-    lineas: list[str] = []
-    for est in estudiantes:
-        if not isinstance(est, dict):
-            raise TypeError("Cada estudiante debe ser un diccionario.")
-        nombre = str(est.get("nombre", "")).strip()
-        ids: list[str] = list(est.get("cursos", []))
-        if not nombre:
-            continue
-        ids_validos = list(filter(lambda cid: cid in cursos, ids))
-        nombres = [cursos[cid] for cid in ids_validos]
-        cursos_txt = ", ".join(nombres) if nombres else "(sin cursos)"
-        lineas.append(f"{nombre}: {cursos_txt}")
-
-    return "\n".join(lineas) + ("\n" if lineas else "")
+    # Un único buffer: cada línea se escribe con su salto, sin lista intermedia.
+    buffer = io.StringIO()
+    escribir = buffer.write
+    for linea in _lineas_reporte(estudiantes, cursos):
+        escribir(linea)
+        escribir("\n")
+    return buffer.getvalue()
 
 
 # ---------------------------
@@ -230,9 +287,12 @@ def generar_reporte(
 # ---------------------------
 
 
+@lru_cache(maxsize=1)
 def _panel_titulo() -> Panel:
     """Construye el encabezado principal con estrellitas y estilos del tema.
 
+    El panel no depende del estado, así que se construye una sola vez.
+
     Returns:
         Panel con título y subtítulo del ejercicio.
     """
@@ -246,12 +306,13 @@ def _panel_titulo() -> Panel:
     return Panel.fit(
         texto,
         title="[accent]Ejercicio 14[/accent]",
-        subtitle="[muted]csv + json + filter + lambda[/muted]",
+        subtitle="[muted]csv + json + comprehensions[/muted]",
         border_style="menu.border",
         box=box.DOUBLE,
     )
 
 
+@lru_cache(maxsize=1)
 def _panel_menu() -> Panel:
     """Panel del menú con opciones y claves resaltadas.
 
@@ -275,15 +336,33 @@ def _panel_menu() -> Panel:
     )
 
 
-def _tabla_reporte(contenido: str) -> Table:
+# A partir de este número de líneas la vista previa usa un solo bloque de texto.
+_MAX_FILAS_TABLA = 100
+
+
+def _tabla_reporte(contenido: str) -> Table | Panel:
     """Crea la tabla de vista previa del reporte.
 
+    Para reportes largos (más de `_MAX_FILAS_TABLA` líneas) no se arma una fila
+    por línea: se numera todo con un único `str.join` dentro de un Panel.
+
     Args:
         contenido: Texto del reporte a mostrar.
 
     Returns:
-        Tabla Rich con numeración y contenido.
+        Tabla Rich con numeración y contenido (o Panel equivalente si es largo).
     """
+    lineas = contenido.splitlines()
+    if len(lineas) > _MAX_FILAS_TABLA:
+        numeradas = "\n".join(
+            f"{idx:>4}  {linea}" for idx, linea in enumerate(lineas, start=1)
+        )
+        return Panel(
+            Text(numeradas, overflow="fold"),
+            title="[accent]Vista previa del reporte[/accent]",
+            border_style="table.border",
+            box=box.MINIMAL_HEAVY_HEAD,
+        )
     tabla = Table(
         title="[accent]Vista previa del reporte[/accent]",
         show_lines=True,
@@ -298,7 +377,7 @@ def _tabla_reporte(contenido: str) -> Table:
     if not contenido.strip():
         tabla.add_row("—", "—")
         return tabla
-    for idx, linea in enumerate(contenido.splitlines(), start=1):
+    for idx, linea in enumerate(lineas, start=1):
         tabla.add_row(str(idx), linea)
     return tabla
 
@@ -340,8 +419,8 @@ def _csv_tiene_encabezados_validos(ruta: Path) -> bool:
             lector = csv.DictReader(fh)
             if lector.fieldnames is None:
                 return False
-            campos = {c.strip() for c in lector.fieldnames}
-            return {"nombre", "cursos"}.issubset(campos)
+            campos = [c.strip() for c in lector.fieldnames]
+            return "nombre" in campos and "cursos" in campos
     except OSError:
         return False
 
@@ -373,26 +452,30 @@ def _asegurar_datos_ejemplo() -> tuple[Path, Path]:
         Tupla (ruta_csv, ruta_json) con las rutas a los archivos de ejemplo.
     """
     _DATA_DIR.mkdir(parents=True, exist_ok=True)
+    # Una sola lectura del directorio en lugar de un stat por archivo.
+    with os.scandir(_DATA_DIR) as entradas:
+        presentes = {e.name for e in entradas}
 
     # CSV: crear o recrear si los encabezados no son los esperados
     crear_csv = True
-    if _ARCH_CSV_DEF.exists() and _csv_tiene_encabezados_validos(_ARCH_CSV_DEF):
+    if _ARCH_CSV_DEF.name in presentes and _csv_tiene_encabezados_validos(
+        _ARCH_CSV_DEF
+    ):
         crear_csv = False
     if crear_csv:
-        filas = [
-            {"nombre": "Ana", "cursos": "PY;JS"},
-            {"nombre": "Juan", "cursos": "DB;JS"},
-            {"nombre": "María", "cursos": "PY;DATA;XXX"},
-            {"nombre": "Sofía", "cursos": ""},
-        ]
+        filas = (
+            ("nombre", "cursos"),
+            ("Ana", "PY;JS"),
+            ("Juan", "DB;JS"),
+            ("María", "PY;DATA;XXX"),
+            ("Sofía", ""),
+        )
         with open(_ARCH_CSV_DEF, "w", encoding="utf-8", newline="") as fh:
-            escritor = csv.DictWriter(fh, fieldnames=["nombre", "cursos"])
-            escritor.writeheader()
-            escritor.writerows(filas)
+            csv.writer(fh).writerows(filas)
 
     # JSON: crear o recrear si la estructura no es válida
     crear_json = True
-    if _ARCH_JSON_DEF.exists() and _json_cursos_valido(_ARCH_JSON_DEF):
+    if _ARCH_JSON_DEF.name in presentes and _json_cursos_valido(_ARCH_JSON_DEF):
         crear_json = False
     if crear_json:
         cursos = [
@@ -443,8 +526,34 @@ def _guardar_reporte(texto: str, destino: Path | None = None) -> None:
     """
     destino = destino or _ARCH_REP_DEF
     destino.parent.mkdir(parents=True, exist_ok=True)
-    with open(destino, "w", encoding="utf-8") as fh:
-        fh.write(texto)
+    destino.write_bytes(texto.encode("utf-8"))
+
+
+# Vista previa del último reporte leído: ruta -> ((mtime_ns, tamaño), vista).
+_cache_vistas: dict[Path, tuple[tuple[int, int], Table | Panel]] = {}
+
+
+def _vista_reporte_guardado(ruta: Path) -> Table | Panel | None:
+    """Devuelve la vista previa del reporte en disco, reutilizándola si no cambió.
+
+    Args:
+        ruta: Ruta del reporte guardado.
+
+    Returns:
+        Tabla (o Panel) de vista previa, o None si el archivo no existe.
+    """
+    try:
+        info = ruta.stat()
+    except FileNotFoundError:
+        _cache_vistas.pop(ruta, None)
+        return None
+    firma = (info.st_mtime_ns, info.st_size)
+    previo = _cache_vistas.get(ruta)
+    if previo is not None and previo[0] == firma:
+        return previo[1]
+    vista = _tabla_reporte(ruta.read_text(encoding="utf-8"))
+    _cache_vistas[ruta] = (firma, vista)
+    return vista
 
 
 # ---------------------------
@@ -464,10 +573,11 @@ def menu() -> None:
     Returns:
         None
     """
+
     while True:
         console.clear()
-        console.print(_panel_titulo())
-        console.print(_panel_menu())
+        # Una sola impresión por pantalla: encabezado y menú se renderizan juntos.
+        console.print(Group(_panel_titulo(), _panel_menu()))
 
         opcion = Prompt.ask(
             "[title]Elige una opción[/title]",
@@ -527,7 +637,8 @@ def menu() -> None:
                 )
 
         elif opcion == "3":
-            if not _ARCH_REP_DEF.exists():
+            vista = _vista_reporte_guardado(_ARCH_REP_DEF)
+            if vista is None:
                 console.print(
                     Panel.fit(
                         "[warn]No existe data/reporte.txt[/warn]",
@@ -537,17 +648,20 @@ def menu() -> None:
                     )
                 )
             else:
-                contenido = _ARCH_REP_DEF.read_text(encoding="utf-8")
-                console.print(_tabla_reporte(contenido))
+                console.print(vista)
 
         elif opcion == "4":
             break
 
-        _ = Prompt.ask(
-            "\n[muted]Enter para continuar (o escribe 'salir' para terminar)[/muted]",
-            default="",
-        )
-        if _.strip().lower() == "salir":
+        # Pausa simple: console.input evita la maquinaria de validación de Prompt.
+        try:
+            respuesta = console.input(
+                "\n[muted]Enter para continuar (o escribe 'salir' para terminar)"
+                "[/muted] "
+            )
+        except EOFError:
+            break
+        if respuesta.strip().lower() == "salir":
             break
 
 
@@ -6,18 +6,25 @@ Funciones:
 - UI: mostrar_libros, menu, main.
 
 Tecnologías:
-- Python 3.x, JSON (json.load/json.dump), Rich (Panel, Table, Columns, Prompt).
+- Python 3.x, JSON (json.loads/json.dumps), Rich (Panel, Table, Columns, Prompt).
 
 Notas:
-- La base de datos se guarda en data/biblioteca.json.
+- La base de datos se guarda en data/biblioteca.json, en JSON compacto
+  (guardar_biblioteca(..., legible=True) lo escribe indentado).
 - El diseño usa un tema característico (verde/menta) con estrellitas.
 """
 
 from __future__ import annotations
 
 import json
+import operator
+import os
+import sys
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from rich import box
 from rich.columns import Columns
@@ -34,6 +41,7 @@ __all__ = [
     "devolver_libro",
     "buscar_libro",
     "ver_libros_prestados",
+    "cambios_en_lote",
     "mostrar_libros",
     "menu",
     "main",
@@ -60,9 +68,18 @@ THEME = Theme(
 )
 console = Console(theme=THEME)
 
-# Carpeta de datos: <root>/data/biblioteca.json
-_DATA_DIR = Path(__file__).resolve().parents[2] / "data"
-_ARCHIVO_BIB = _DATA_DIR / "biblioteca.json"
+
+@lru_cache(maxsize=1)
+def _archivo_por_defecto() -> Path:
+    """Ruta por defecto de la biblioteca: <root>/data/biblioteca.json.
+
+    Se resuelve en el primer uso real y no al importar el módulo, así que quien
+    siempre pasa `ruta` nunca paga el `Path.resolve()`.
+
+    Returns:
+        Ruta absoluta del archivo de biblioteca en la carpeta data del proyecto.
+    """
+    return Path(__file__).resolve().parents[2] / "data" / "biblioteca.json"
 
 
 # ---------------------------
@@ -79,63 +96,31 @@ def _ruta_biblioteca(ruta: Path | None = None) -> Path:
     Returns:
         Ruta del archivo a utilizar (Path).
     """
-    return ruta if ruta is not None else _ARCHIVO_BIB
+    return ruta if ruta is not None else _archivo_por_defecto()
 
 
-def _normalizar_id(texto: str) -> str:
-    """Normaliza y valida el id del libro.
+def _normalizar_texto(texto: Any, campo: str) -> str:
+    """Normaliza y valida un campo de texto (id, título o nombre).
 
     Colapsa espacios y verifica que no quede vacío.
 
     Args:
-        texto: Identificador del libro.
-
-    Returns:
-        ID normalizado (sin espacios duplicados).
-
-    Raises:
-        ValueError: Si el id queda vacío tras normalizar.
-    """
-    limpio = " ".join(str(texto).split())
-    if not limpio:
-        raise ValueError("El id del libro no puede estar vacío.")
-    return limpio
-
-
-def _normalizar_nombre(texto: str) -> str:
-    """Normaliza y valida el nombre del aprendiz.
-
-    Args:
-        texto: Nombre libre del aprendiz.
+        texto: Valor a normalizar (se convierte a str si no lo es).
+        campo: Sujeto del mensaje de error, p. ej. "El id del libro".
 
     Returns:
-        Nombre normalizado.
+        Texto normalizado (sin espacios duplicados ni en los extremos).
 
     Raises:
-        ValueError: Si el nombre queda vacío tras normalizar.
+        ValueError: Si el texto queda vacío tras normalizar.
     """
     limpio = " ".join(str(texto).split())
     if not limpio:
-        raise ValueError("El nombre del aprendiz no puede estar vacío.")
+        raise ValueError(f"{campo} no puede estar vacío.")
     return limpio
 
 
-def _normalizar_titulo(texto: str) -> str:
-    """Normaliza y valida el título del libro.
-
-    Args:
-        texto: Título del libro.
-
-    Returns:
-        Título normalizado.
-
-    Raises:
-        ValueError: Si el título queda vacío tras normalizar.
-    """
-    limpio = " ".join(str(texto).split())
-    if not limpio:
-        raise ValueError("El título no puede estar vacío.")
-    return limpio
+_CLAVES_LIBRO = frozenset(("libro_id", "titulo", "prestado_a"))
 
 
 def _validar_libro_dict(libro: dict[str, Any]) -> dict[str, Any]:
@@ -158,24 +143,78 @@ def _validar_libro_dict(libro: dict[str, Any]) -> dict[str, Any]:
     """
     if not isinstance(libro, dict):
         raise TypeError("Cada libro debe ser un diccionario.")
-    for clave in ("libro_id", "titulo", "prestado_a"):
-        if clave not in libro:
-            raise TypeError(f"Falta la clave obligatoria: {clave!r}")
-
-    libro_id = _normalizar_id(str(libro["libro_id"]))
-    titulo = _normalizar_titulo(str(libro["titulo"]))
-    prest_raw = libro["prestado_a"]
-    if prest_raw is None:
-        prestado_a: str | None = None
-    else:
-        prestado_a = _normalizar_nombre(str(prest_raw))
+    if not libro.keys() >= _CLAVES_LIBRO:
+        for clave in ("libro_id", "titulo", "prestado_a"):
+            if clave not in libro:
+                raise TypeError(f"Falta la clave obligatoria: {clave!r}")
+
+    libro_id = _normalizar_texto(libro["libro_id"], "El id del libro")
+    titulo = _normalizar_texto(libro["titulo"], "El título")
+    prestado_a = libro["prestado_a"]
+    if prestado_a is not None:
+        prestado_a = _normalizar_texto(prestado_a, "El nombre del aprendiz")
+
+    # Id y título internados: las recargas comparten un único objeto por valor.
+    return {
+        "libro_id": sys.intern(libro_id),
+        "titulo": sys.intern(titulo),
+        "prestado_a": prestado_a,
+    }
+
+
+# Índices por id: id(lista) -> (lista, {id plegado: posición}).
+# Se guarda también la lista: mantenerla viva impide que su id se reutilice.
+_MAX_CACHE_INDICES = 4
+_cache_indices: OrderedDict[int, tuple[list[dict[str, Any]], dict[str, int]]] = (
+    OrderedDict()
+)
 
-    return {"libro_id": libro_id, "titulo": titulo, "prestado_a": prestado_a}
+
+def _indexar_ids(biblioteca: list[dict[str, Any]]) -> dict[str, int]:
+    """Construye y registra el índice id -> posición de una biblioteca.
+
+    Ante ids repetidos conserva la primera aparición, igual que un recorrido
+    lineal.
+
+    Args:
+        biblioteca: Lista de libros.
+
+    Returns:
+        Diccionario con el id plegado como clave y su índice como valor.
+    """
+    indice: dict[str, int] = {}
+    for idx, libro in enumerate(biblioteca):
+        indice.setdefault(str(libro.get("libro_id", "")).casefold(), idx)
+    _registrar_indice_ids(biblioteca, indice)
+    return indice
+
+
+def _registrar_indice_ids(
+    biblioteca: list[dict[str, Any]],
+    indice: dict[str, int],
+) -> None:
+    """Guarda el índice de ids de una biblioteca en la caché acotada.
+
+    Args:
+        biblioteca: Lista de libros indexada.
+        indice: Índice id plegado -> posición de esa lista.
+
+    Returns:
+        None
+    """
+    _cache_indices[id(biblioteca)] = (biblioteca, indice)
+    _cache_indices.move_to_end(id(biblioteca))
+    if len(_cache_indices) > _MAX_CACHE_INDICES:
+        _cache_indices.popitem(last=False)
 
 
 def _buscar_indice(biblioteca: list[dict[str, Any]], libro_id: str) -> int | None:
     """Busca el índice de un libro por id (insensible a mayúsculas).
 
+    Consulta un índice en memoria (O(1)); cada acierto se verifica contra la
+    lista y, si el índice falta o quedó obsoleto (la lista se modificó por
+    fuera del módulo), se reconstruye una vez.
+
     Args:
         biblioteca: Lista de libros.
         libro_id: Identificador a localizar.
@@ -183,11 +222,17 @@ def _buscar_indice(biblioteca: list[dict[str, Any]], libro_id: str) -> int | Non
     Returns:
         Índice del libro si se encuentra; None en caso contrario.
     """
-    objetivo = _normalizar_id(libro_id).lower()
-    for idx, libro in enumerate(biblioteca):
-        if str(libro.get("libro_id", "")).lower() == objetivo:
+    objetivo = _normalizar_texto(libro_id, "El id del libro").casefold()
+    entrada = _cache_indices.get(id(biblioteca))
+    if entrada is not None and entrada[0] is biblioteca:
+        idx = entrada[1].get(objetivo)
+        if (
+            idx is not None
+            and idx < len(biblioteca)
+            and str(biblioteca[idx].get("libro_id", "")).casefold() == objetivo
+        ):
             return idx
-    return None
+    return _indexar_ids(biblioteca).get(objetivo)
 
 
 # ---------------------------
@@ -198,6 +243,10 @@ def _buscar_indice(biblioteca: list[dict[str, Any]], libro_id: str) -> int | Non
 def cargar_biblioteca(ruta: Path | None = None) -> list[dict[str, Any]]:
     """Carga la biblioteca desde JSON; ignora entradas inválidas.
 
+    En la misma pasada que valida cada libro se construye el índice id ->
+    posición, de modo que prestar o devolver no vuelve a recorrer la lista. El
+    índice de trigramas de títulos se deja para la primera búsqueda.
+
     Args:
         ruta: Ruta alternativa del archivo (opcional).
 
@@ -205,34 +254,48 @@ def cargar_biblioteca(ruta: Path | None = None) -> list[dict[str, Any]]:
         Lista de libros normalizados. Si el archivo no existe o es inválido, [].
     """
     archivo = _ruta_biblioteca(ruta)
-    if not archivo.exists():
-        return []
     try:
-        datos = json.loads(archivo.read_text(encoding="utf-8") or "[]")
-    except json.JSONDecodeError:
+        # Lectura completa en bytes: json.loads detecta UTF-8 por sí mismo y se
+        # evita la capa de texto y la cadena intermedia.
+        datos = json.loads(archivo.read_bytes() or b"[]")
+    except FileNotFoundError:
+        return []
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return []
 
     if not isinstance(datos, list):
         return []
 
     libros: list[dict[str, Any]] = []
+    ids: dict[str, int] = {}
     for item in datos:
         try:
-            libros.append(_validar_libro_dict(item))
+            libro = _validar_libro_dict(item)
         except (TypeError, ValueError):
             continue
+        pos = len(libros)
+        libros.append(libro)
+        ids.setdefault(libro["libro_id"].casefold(), pos)
+
+    _registrar_indice_ids(libros, ids)
     return libros
 
 
 def guardar_biblioteca(
     biblioteca: list[dict[str, Any]],
     ruta: Path | None = None,
+    legible: bool = False,
 ) -> None:
-    """Guarda la biblioteca en disco (JSON indentado, UTF-8).
+    """Guarda la biblioteca en disco (JSON compacto, UTF-8).
+
+    El contenido se escribe en un archivo temporal que luego reemplaza al
+    original, de modo que nunca queda un archivo a medio escribir.
 
     Args:
         biblioteca: Lista de libros a persistir.
         ruta: Ruta alternativa del archivo (opcional).
+        legible: Si True, indenta el JSON para leerlo a mano (archivo más
+            grande); por defecto se escribe sin espacios.
 
     Returns:
         None
@@ -249,8 +312,66 @@ def guardar_biblioteca(
 
     archivo = _ruta_biblioteca(ruta)
     archivo.parent.mkdir(parents=True, exist_ok=True)
-    with open(archivo, "w", encoding="utf-8") as fh:
-        json.dump(normalizados, fh, ensure_ascii=False, indent=2)
+    # Se serializa de una vez con el codificador en C y se escribe en bytes:
+    # json.dump sobre un archivo de texto emite muchos fragmentos pequeños.
+    if legible:
+        texto = json.dumps(normalizados, ensure_ascii=False, indent=2)
+    else:
+        texto = json.dumps(normalizados, ensure_ascii=False, separators=(",", ":"))
+    contenido = texto.encode("utf-8")
+    # Escritura atómica: un corte a mitad de escritura no deja el JSON truncado.
+    temporal = archivo.with_name(archivo.name + ".tmp")
+    temporal.write_bytes(contenido)
+    os.replace(temporal, archivo)
+
+
+# Escrituras pendientes mientras hay un lote activo: archivo -> biblioteca.
+_pendientes: dict[Path, list[dict[str, Any]]] | None = None
+
+
+def _persistir(biblioteca: list[dict[str, Any]], ruta: Path | None) -> None:
+    """Guarda la biblioteca (o la deja pendiente si hay un lote activo).
+
+    Args:
+        biblioteca: Lista de libros a persistir.
+        ruta: Ruta alternativa del archivo.
+
+    Returns:
+        None
+    """
+    if _pendientes is None:
+        guardar_biblioteca(biblioteca, ruta=ruta)
+    else:
+        _pendientes[_ruta_biblioteca(ruta)] = biblioteca
+
+
+@contextmanager
+def cambios_en_lote() -> Iterator[None]:
+    """Agrupa varios préstamos/devoluciones en una sola escritura por archivo.
+
+    Dentro del bloque, `prestar_libro` y `devolver_libro` no escriben en disco;
+    al salir (también por una excepción) se guarda una vez el último estado de
+    cada archivo tocado. Los lotes anidados se integran en el más externo.
+
+    Yields:
+        None
+
+    Ejemplo:
+        >>> with cambios_en_lote():  # doctest: +SKIP
+        ...     prestar_libro(biblioteca, "001", "Ana")
+        ...     devolver_libro(biblioteca, "002")
+    """
+    global _pendientes
+    if _pendientes is not None:
+        yield
+        return
+    _pendientes = {}
+    try:
+        yield
+    finally:
+        pendientes, _pendientes = _pendientes, None
+        for archivo, biblioteca in pendientes.items():
+            guardar_biblioteca(biblioteca, ruta=archivo)
 
 
 # ---------------------------
@@ -266,6 +387,8 @@ def prestar_libro(
 ) -> dict[str, Any]:
     """Marca un libro como prestado a un aprendiz y persiste el cambio.
 
+    Dentro de `cambios_en_lote()` la escritura se difiere al cerrar el lote.
+
     Args:
         biblioteca: Lista en memoria a modificar.
         libro_id: Identificador del libro a prestar.
@@ -283,13 +406,13 @@ def prestar_libro(
     if indice is None:
         raise KeyError(f"No existe el libro con id: {libro_id!r}")
 
-    aprendiz = _normalizar_nombre(nombre_aprendiz)
+    aprendiz = _normalizar_texto(nombre_aprendiz, "El nombre del aprendiz")
     libro = biblioteca[indice]
     if libro["prestado_a"] is not None:
         raise ValueError("El libro ya está prestado.")
     libro["prestado_a"] = aprendiz
 
-    guardar_biblioteca(biblioteca, ruta=ruta)
+    _persistir(biblioteca, ruta)
     return libro
 
 
@@ -300,6 +423,8 @@ def devolver_libro(
 ) -> dict[str, Any]:
     """Marca un libro como disponible (prestado_a = None) y persiste.
 
+    Dentro de `cambios_en_lote()` la escritura se difiere al cerrar el lote.
+
     Args:
         biblioteca: Lista en memoria a modificar.
         libro_id: Identificador del libro a devolver.
@@ -321,17 +446,134 @@ def devolver_libro(
         raise ValueError("El libro no estaba prestado.")
     libro["prestado_a"] = None
 
-    guardar_biblioteca(biblioteca, ruta=ruta)
+    _persistir(biblioteca, ruta)
     return libro
 
 
+# Índice invertido de trigramas por lista, con los resultados ya calculados:
+# id(lista) -> (lista, títulos indexados, {trigrama: posiciones},
+#               {consulta: posiciones coincidentes}).
+_LARGO_TRIGRAMA = 3
+_MAX_CACHE_TRIGRAMAS = 4
+_MAX_RESULTADOS = 128
+_cache_trigramas: OrderedDict[
+    int,
+    tuple[
+        list[dict[str, Any]],
+        tuple[Any, ...],
+        dict[str, set[int]],
+        dict[str, tuple[int, ...]],
+    ],
+] = OrderedDict()
+_titulo_de = operator.itemgetter("titulo")
+_SIN_POSICIONES: frozenset[int] = frozenset()
+
+
+def _trigramas(texto: str) -> set[str]:
+    """Subcadenas de tres caracteres contenidas en un texto.
+
+    Args:
+        texto: Texto ya plegado (casefold).
+
+    Returns:
+        Conjunto de trigramas (vacío si el texto es más corto).
+    """
+    return {
+        texto[i : i + _LARGO_TRIGRAMA] for i in range(len(texto) - _LARGO_TRIGRAMA + 1)
+    }
+
+
+def _indice_trigramas(
+    biblioteca: list[dict[str, Any]],
+    titulos: tuple[Any, ...],
+) -> tuple[dict[str, set[int]], dict[str, tuple[int, ...]]]:
+    """Obtiene (o construye) el índice trigrama -> posiciones de una biblioteca.
+
+    El índice se reutiliza mientras la lista conserve los mismos títulos; la
+    comparación de la tupla de títulos se resuelve en C y casi siempre por
+    identidad, así que detectar cambios es mucho más barato que reindexar.
+    Junto al índice viaja la memoria de resultados por consulta, que se
+    descarta con él.
+
+    Args:
+        biblioteca: Lista de libros.
+        titulos: Títulos actuales de la lista, en orden.
+
+    Returns:
+        Tupla (índice, resultados): cada trigrama con las posiciones de los
+        títulos que lo contienen, y cada consulta ya resuelta con sus
+        posiciones coincidentes.
+    """
+    entrada = _cache_trigramas.get(id(biblioteca))
+    if entrada is not None and entrada[0] is biblioteca and entrada[1] == titulos:
+        _cache_trigramas.move_to_end(id(biblioteca))
+        return entrada[2], entrada[3]
+
+    indice: dict[str, set[int]] = {}
+    for pos, titulo in enumerate(titulos):
+        for trigrama in _trigramas(str(titulo).casefold()):
+            indice.setdefault(trigrama, set()).add(pos)
+    return indice, _registrar_indice_trigramas(biblioteca, titulos, indice)
+
+
+def _registrar_indice_trigramas(
+    biblioteca: list[dict[str, Any]],
+    titulos: tuple[Any, ...],
+    indice: dict[str, set[int]],
+) -> dict[str, tuple[int, ...]]:
+    """Guarda el índice de trigramas de una biblioteca en la caché acotada.
+
+    Args:
+        biblioteca: Lista de libros indexada.
+        titulos: Títulos de esa lista, en orden.
+        indice: Índice trigrama -> posiciones de esos títulos.
+
+    Returns:
+        Memoria de resultados por consulta (vacía) asociada al índice.
+    """
+    resultados: dict[str, tuple[int, ...]] = {}
+    _cache_trigramas[id(biblioteca)] = (biblioteca, titulos, indice, resultados)
+    _cache_trigramas.move_to_end(id(biblioteca))
+    if len(_cache_trigramas) > _MAX_CACHE_TRIGRAMAS:
+        _cache_trigramas.popitem(last=False)
+    return resultados
+
+
+def _posiciones_coincidentes(
+    consulta: str,
+    titulos: tuple[Any, ...],
+    indice: dict[str, set[int]],
+) -> tuple[int, ...]:
+    """Posiciones, en orden, de los títulos que contienen la consulta.
+
+    Args:
+        consulta: Texto ya normalizado y plegado (casefold).
+        titulos: Títulos de la biblioteca, en orden.
+        indice: Índice de trigramas de esos títulos.
+
+    Returns:
+        Tupla ordenada de posiciones coincidentes.
+    """
+    if len(consulta) < _LARGO_TRIGRAMA:
+        candidatos: Iterable[int] = range(len(titulos))
+    else:
+        posiciones = sorted(
+            (indice.get(t, _SIN_POSICIONES) for t in _trigramas(consulta)), key=len
+        )
+        candidatos = sorted(set(posiciones[0]).intersection(*posiciones[1:]))
+    return tuple(pos for pos in candidatos if consulta in str(titulos[pos]).casefold())
+
+
 def buscar_libro(
     biblioteca: list[dict[str, Any]],
     query: str,
 ) -> list[dict[str, Any]]:
     """Busca libros por título (contiene, insensible a mayúsculas).
 
-    Usa filter + lambda.
+    Con consultas de tres o más caracteres, un índice invertido de trigramas
+    reduce los candidatos a los títulos que contienen todos los trigramas de la
+    consulta; solo esos se comparan por subcadena. Las posiciones encontradas se
+    recuerdan por consulta hasta que cambian los títulos de la lista.
 
     Args:
         biblioteca: Lista de libros.
@@ -344,32 +586,38 @@ def buscar_libro(
     if not consulta:
         return []
 
-    return list(
-        filter(
-            lambda _: consulta in str(_.get("titulo", "")).casefold(),
-            biblioteca,
-        )
-    )
+    try:
+        titulos = tuple(map(_titulo_de, biblioteca))
+    except (KeyError, TypeError):
+        titulos = None
+    if titulos is None:
+        return [
+            libro
+            for libro in biblioteca
+            if consulta in str(libro.get("titulo", "")).casefold()
+        ]
+
+    indice, resultados = _indice_trigramas(biblioteca, titulos)
+    posiciones = resultados.get(consulta)
+    if posiciones is None:
+        posiciones = _posiciones_coincidentes(consulta, titulos, indice)
+        if len(resultados) >= _MAX_RESULTADOS:
+            del resultados[next(iter(resultados))]
+        resultados[consulta] = posiciones
+    return [biblioteca[pos] for pos in posiciones]
 
 
 def ver_libros_prestados(biblioteca: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Devuelve todos los libros actualmente prestados.
 
-    Usa filter + lambda.
-
     Args:
-        biblioteca: Lista de libros.
+        biblioteca: Lista de libros (validados: prestado_a es None o un nombre
+            normalizado no vacío).
 
     Returns:
         Lista de libros con prestado_a no vacío.
     """
-    return list(
-        filter(
-            lambda _: (_.get("prestado_a") is not None)
-            and bool(str(_.get("prestado_a")).strip()),
-            biblioteca,
-        )
-    )
+    return [libro for libro in biblioteca if libro.get("prestado_a")]
 
 
 # ---------------------------
@@ -377,9 +625,12 @@ def ver_libros_prestados(biblioteca: list[dict[str, Any]]) -> list[dict[str, Any
 # ---------------------------
 
 
+@lru_cache(maxsize=1)
 def _panel_titulo() -> Panel:
     """Construye el panel de encabezado con estrellitas y estilos del tema.
 
+    El panel no depende del estado, así que se construye una sola vez.
+
     Returns:
         Panel con título y subtítulo del ejercicio.
     """
@@ -393,15 +644,18 @@ def _panel_titulo() -> Panel:
     return Panel.fit(
         texto,
         title="[accent]Ejercicio 15[/accent]",
-        subtitle="[muted]JSON + filter + lambda[/muted]",
+        subtitle="[muted]JSON + índices en memoria[/muted]",
         border_style="menu.border",
         box=box.DOUBLE,
     )
 
 
+@lru_cache(maxsize=1)
 def _panel_menu() -> Panel:
     """Panel del menú con opciones y claves resaltadas.
 
+    Se construye una sola vez y se reutiliza en cada vuelta del menú.
+
     Returns:
         Panel estilizado con las opciones disponibles.
     """
@@ -450,6 +704,7 @@ def _tabla_libros(libros: list[dict[str, Any]], titulo: str) -> Table:
     return tabla
 
 
+@lru_cache(maxsize=4)
 def _panel_info_archivo(archivo: Path) -> Panel:
     """Panel informativo con la ubicación del archivo de datos.
 
@@ -480,17 +735,23 @@ def mostrar_libros(
     Returns:
         None
     """
-    paneles = [_panel_info_archivo(_ARCHIVO_BIB), _tabla_libros(libros, titulo)]
+    paneles = [
+        _panel_info_archivo(_archivo_por_defecto()),
+        _tabla_libros(libros, titulo),
+    ]
     console.print(Columns(paneles, equal=True, expand=True))
 
 
-def _asegurar_ejemplo() -> None:
+def _asegurar_ejemplo(archivo: Path) -> None:
     """Crea biblioteca de ejemplo si no existe el archivo.
 
+    Args:
+        archivo: Ruta del JSON de biblioteca (guardar crea su carpeta).
+
     Returns:
         None
     """
-    if _ARCHIVO_BIB.exists():
+    if archivo.exists():
         return
     ejemplo = [
         {"libro_id": "001", "titulo": "Cien Años de Soledad", "prestado_a": None},
@@ -502,7 +763,7 @@ def _asegurar_ejemplo() -> None:
         {"libro_id": "003", "titulo": "La Ciudad y los Perros", "prestado_a": None},
         {"libro_id": "004", "titulo": "Rayuela", "prestado_a": None},
     ]
-    guardar_biblioteca(ejemplo)
+    guardar_biblioteca(ejemplo, ruta=archivo)
 
 
 # ---------------------------
@@ -514,6 +775,7 @@ def menu() -> None:
     """Interfaz con Rich para gestionar préstamos de la biblioteca.
 
     Muestra un menú interactivo para listar, buscar, prestar y devolver libros.
+    Los cambios se guardan en disco al salir del menú.
 
     Args:
         None
@@ -521,88 +783,93 @@ def menu() -> None:
     Returns:
         None
     """
-    _DATA_DIR.mkdir(parents=True, exist_ok=True)
-    _asegurar_ejemplo()
-    biblioteca = cargar_biblioteca()
-
-    while True:
-        console.clear()
-        console.print(_panel_titulo())
-        console.print(_panel_menu())
-
-        opcion = Prompt.ask(
-            "[title]Elige una opción[/title]",
-            choices=["1", "2", "3", "4", "5", "6"],
-            default="1",
-        )
-
-        if opcion == "1":
-            mostrar_libros(biblioteca, "Todos los libros")
-
-        elif opcion == "2":
-            mostrar_libros(ver_libros_prestados(biblioteca), "Prestados")
-
-        elif opcion == "3":
-            q = Prompt.ask(
-                "[accent]Título o parte del título a buscar[/accent]"
-            ).strip()
-            mostrar_libros(buscar_libro(biblioteca, q), f"Búsqueda: {q}")
-
-        elif opcion == "4":
-            try:
-                libro_id = Prompt.ask("[accent]ID del libro[/accent]").strip()
-                aprendiz = Prompt.ask("[accent]Nombre del aprendiz[/accent]").strip()
-                libro = prestar_libro(biblioteca, libro_id, aprendiz)
-                console.print(
-                    Panel.fit(
-                        f"[ok]★ Préstamo registrado:[/ok] {libro['titulo']}"
-                        f" -> [accent]{libro['prestado_a']}[/accent]",
-                        border_style="ok",
-                        title="[accent]OK[/accent]",
-                        box=box.ROUNDED,
+    archivo = _archivo_por_defecto()
+    _asegurar_ejemplo(archivo)
+    biblioteca = cargar_biblioteca(archivo)
+
+    # Los préstamos y devoluciones se guardan una sola vez, al salir del menú.
+    with cambios_en_lote():
+        while True:
+            console.clear()
+            console.print(_panel_titulo())
+            console.print(_panel_menu())
+
+            opcion = Prompt.ask(
+                "[title]Elige una opción[/title]",
+                choices=["1", "2", "3", "4", "5", "6"],
+                default="1",
+            )
+
+            if opcion == "1":
+                mostrar_libros(biblioteca, "Todos los libros")
+
+            elif opcion == "2":
+                mostrar_libros(ver_libros_prestados(biblioteca), "Prestados")
+
+            elif opcion == "3":
+                q = Prompt.ask(
+                    "[accent]Título o parte del título a buscar[/accent]"
+                ).strip()
+                mostrar_libros(buscar_libro(biblioteca, q), f"Búsqueda: {q}")
+
+            elif opcion == "4":
+                try:
+                    libro_id = Prompt.ask("[accent]ID del libro[/accent]").strip()
+                    aprendiz = Prompt.ask(
+                        "[accent]Nombre del aprendiz[/accent]"
+                    ).strip()
+                    libro = prestar_libro(biblioteca, libro_id, aprendiz)
+                    console.print(
+                        Panel.fit(
+                            f"[ok]★ Préstamo registrado:[/ok] {libro['titulo']}"
+                            f" -> [accent]{libro['prestado_a']}[/accent]",
+                            border_style="ok",
+                            title="[accent]OK[/accent]",
+                            box=box.ROUNDED,
+                        )
                     )
-                )
-            except (KeyError, ValueError) as exc:
-                console.print(
-                    Panel.fit(
-                        f"[error]Error:[/error] {exc}",
-                        border_style="error",
-                        title="[accent]Operación inválida[/accent]",
-                        box=box.HEAVY,
+                except (KeyError, ValueError) as exc:
+                    console.print(
+                        Panel.fit(
+                            f"[error]Error:[/error] {exc}",
+                            border_style="error",
+                            title="[accent]Operación inválida[/accent]",
+                            box=box.HEAVY,
+                        )
                     )
-                )
-
-        elif opcion == "5":
-            try:
-                libro_id = Prompt.ask("[accent]ID del libro[/accent]").strip()
-                libro = devolver_libro(biblioteca, libro_id)
-                console.print(
-                    Panel.fit(
-                        f"[ok]★ Devolución completada:[/ok] {libro['titulo']}",
-                        border_style="ok",
-                        title="[accent]OK[/accent]",
-                        box=box.ROUNDED,
+
+            elif opcion == "5":
+                try:
+                    libro_id = Prompt.ask("[accent]ID del libro[/accent]").strip()
+                    libro = devolver_libro(biblioteca, libro_id)
+                    console.print(
+                        Panel.fit(
+                            f"[ok]★ Devolución completada:[/ok] {libro['titulo']}",
+                            border_style="ok",
+                            title="[accent]OK[/accent]",
+                            box=box.ROUNDED,
+                        )
                     )
-                )
-            except (KeyError, ValueError) as exc:
-                console.print(
-                    Panel.fit(
-                        f"[error]Error:[/error] {exc}",
-                        border_style="error",
-                        title="[accent]Operación inválida[/accent]",
-                        box=box.HEAVY,
+                except (KeyError, ValueError) as exc:
+                    console.print(
+                        Panel.fit(
+                            f"[error]Error:[/error] {exc}",
+                            border_style="error",
+                            title="[accent]Operación inválida[/accent]",
+                            box=box.HEAVY,
+                        )
                     )
-                )
 
-        elif opcion == "6":
-            break
+            elif opcion == "6":
+                break
 
-        _ = Prompt.ask(
-            "\n[muted]Enter para continuar (o escribe 'salir' para terminar)[/muted]",
-            default="",
-        )
-        if _.strip().lower() == "salir":
-            break
+            _ = Prompt.ask(
+                "\n[muted]Enter para continuar "
+                "(o escribe 'salir' para terminar)[/muted]",
+                default="",
+            )
+            if _.strip().lower() == "salir":
+                break
 
 
 def main() -> None:
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import pytest
+
 from src.bloque2.ejercicio_10_explorador_recursivo import (
     explorar_estructura,
     filtrar_atomos,
 )
 
+# Pruebas puramente en memoria (sin disco ni red): `pytest -m fast`.
+pytestmark = pytest.mark.fast
+
 
 def test_ejemplo_basico_lista_y_dict() -> None:
     estructura = [1, [2, 3], {"a": 4}]
@@ -21,6 +21,22 @@ def test_cargar_inexistente_devuelve_lista_vacia(tmp_path: Path) -> None:
     assert inv.cargar_inventario(ruta=ruta) == []
 
 
+def test_cargar_ignora_invalidos_y_tolera_corruptos(tmp_path: Path) -> None:
+    ruta = tmp_path / "inventario.json"
+    ruta.write_text(
+        '[{"nombre": " Lapiz ", "precio": 1.5, "stock": 3},'
+        ' {"nombre": "Malo", "precio": -1, "stock": 1}, 7]',
+        encoding="utf-8",
+    )
+    assert inv.cargar_inventario(ruta=ruta) == [
+        {"nombre": "Lapiz", "precio": 1.5, "stock": 3}
+    ]
+
+    for contenido in ('{"nombre": "X"}', '[{"nombre": "X", "precio": 1, "stock": 1},'):
+        ruta.write_text(contenido, encoding="utf-8")
+        assert inv.cargar_inventario(ruta=ruta) == []
+
+
 def test_guardar_y_cargar_persistencia(tmp_path: Path) -> None:
     ruta = tmp_path / "inventario.json"
     inventario: list[dict[str, Any]] = []
@@ -39,6 +55,21 @@ def test_guardar_y_cargar_persistencia(tmp_path: Path) -> None:
     assert isinstance(datos_json, list) and len(datos_json) == len(esperados)
 
 
+def test_guardar_atomico_y_sin_cambios_no_reescribe(tmp_path: Path) -> None:
+    ruta = tmp_path / "inventario.json"
+    inventario = [{"nombre": "Mesa", "precio": 50.0, "stock": 2}]
+    inv.guardar_inventario(inventario, ruta=ruta)
+    inodo = ruta.stat().st_ino
+
+    inv.guardar_inventario(inventario, ruta=ruta)
+    assert ruta.stat().st_ino == inodo
+
+    inventario[0]["stock"] = 3
+    inv.guardar_inventario(inventario, ruta=ruta)
+    assert _leer_json(ruta) == inventario
+    assert [p.name for p in tmp_path.iterdir()] == ["inventario.json"]
+
+
 def test_agregar_existente_acumula_y_actualiza_precio(tmp_path: Path) -> None:
     ruta = tmp_path / "inventario.json"
     inventario: list[dict[str, Any]] = []
@@ -57,6 +88,30 @@ def test_agregar_existente_acumula_y_actualiza_precio(tmp_path: Path) -> None:
     }
 
 
+def test_cambios_en_lote_escribe_una_sola_vez(tmp_path: Path, monkeypatch) -> None:
+    ruta = tmp_path / "inventario.json"
+    inventario: list[dict[str, Any]] = []
+    escrituras: list[Path | None] = []
+    guardar_real = inv.guardar_inventario
+
+    def _contar(inventario_, ruta=None):
+        escrituras.append(ruta)
+        guardar_real(inventario_, ruta=ruta)
+
+    monkeypatch.setattr(inv, "guardar_inventario", _contar)
+    with inv.cambios_en_lote():
+        inv.agregar_producto(inventario, "A", 1.0, 3, ruta=ruta)
+        inv.agregar_producto(inventario, "B", 2.0, 1, ruta=ruta)
+        inv.vender_producto(inventario, "A", 1, ruta=ruta)
+        assert not ruta.exists()
+
+    assert escrituras == [ruta]
+    assert [(p["nombre"], p["stock"]) for p in _leer_json(ruta)] == [
+        ("A", 2),
+        ("B", 1),
+    ]
+
+
 def test_vender_producto_y_validaciones(tmp_path: Path) -> None:
     ruta = tmp_path / "inventario.json"
     inventario: list[dict[str, Any]] = []
@@ -106,3 +161,56 @@ def test_mostrar_inventario_devuelve_tabla(tmp_path: Path, monkeypatch) -> None:
     # Columns contiene una colección; validamos que el objeto sea Columns.
     assert isinstance(capturado["obj"], Columns)
     # No es trivial introspectar Columns; basta con que no haya explotado.
+
+
+def test_mostrar_inventario_refleja_cambios_directos(
+    tmp_path: Path, monkeypatch
+) -> None:
+    ruta = tmp_path / "inventario.json"
+    inventario: list[dict[str, Any]] = []
+    inv.agregar_producto(inventario, "X", 10.0, 1, ruta=ruta)
+
+    tablas: list[Any] = []
+    monkeypatch.setattr(
+        inv.console, "print", lambda obj: tablas.append(obj.renderables[1])
+    )
+    inv.mostrar_inventario(inventario)
+    inventario.append({"nombre": "Y", "precio": 5.0, "stock": 2})
+    inv.mostrar_inventario(inventario)
+    assert [t.row_count for t in tablas] == [1, 2]
+
+
+def test_cargar_repetido_devuelve_copias_independientes(tmp_path: Path) -> None:
+    ruta = tmp_path / "inventario.json"
+    inv.guardar_inventario([{"nombre": "Silla", "precio": 20.0, "stock": 4}], ruta)
+
+    primera = inv.cargar_inventario(ruta=ruta)
+    primera[0]["stock"] = 0
+    assert inv.cargar_inventario(ruta=ruta) == [
+        {"nombre": "Silla", "precio": 20.0, "stock": 4}
+    ]
+
+    inv.guardar_inventario(primera, ruta)
+    assert inv.cargar_inventario(ruta=ruta) == primera
+
+
+def test_cache_de_cargas_acotada(tmp_path: Path) -> None:
+    rutas = [tmp_path / f"inv_{i}.json" for i in range(inv._MAX_CACHE_CARGAS + 2)]
+    for ruta in rutas:
+        inv.guardar_inventario([{"nombre": "A", "precio": 1.0, "stock": 1}], ruta)
+        inv.cargar_inventario(ruta=ruta)
+    # Solo sobreviven las últimas cargas, en orden de uso.
+    assert list(inv._cache_cargas) == rutas[-inv._MAX_CACHE_CARGAS :]
+
+
+def test_operaciones_aceptan_productos_sin_normalizar(tmp_path: Path) -> None:
+    ruta = tmp_path / "inventario.json"
+    inventario: list[dict[str, Any]] = [
+        {"nombre": "Lapiz", "precio": "1.5", "stock": "5"},
+        {"nombre": "Goma", "precio": "2", "stock": "0"},
+    ]
+    assert [p["nombre"] for p in inv.filtrar_disponibles(inventario)] == ["Lapiz"]
+    agregado = inv.agregar_producto(inventario, "lapiz", 1.5, 3, ruta=ruta)
+    assert agregado["stock"] == 5 + 3
+    vendido = inv.vender_producto(inventario, "LAPIZ", 1, ruta=ruta)
+    assert vendido["stock"] == 5 + 3 - 1
@@ -7,7 +7,9 @@ from typing import Any
 
 import pytest
 
+import src.bloque3.ejercicio_14_generador_reportes as rep
 from src.bloque3.ejercicio_14_generador_reportes import (
+    _vista_reporte_guardado,
     generar_reporte,
     leer_csv_estudiantes,
     leer_json_cursos,
@@ -54,6 +56,14 @@ def test_lectura_csv_basica(tmp_path: Path) -> None:
     assert juan["cursos"] == ["DB", "PY"]
 
 
+def test_lectura_csv_columnas_en_otro_orden(tmp_path: Path) -> None:
+    ruta = tmp_path / "est.csv"
+    ruta.write_text("cursos, nombre \nPY;JS,Ana\n\nDB\n", encoding="utf-8")
+    assert leer_csv_estudiantes(str(ruta)) == [
+        {"nombre": "Ana", "cursos": ["PY", "JS"]}
+    ]
+
+
 def test_lectura_json_formato_mapa_y_lista(tmp_path: Path) -> None:
     ruta_mapa = _json_tmp_mapa(tmp_path, "c1.json", {"PY": "Python", "JS": "JS"})
     ruta_lista = _json_tmp_lista(tmp_path, "c2.json", [{"id": "DB", "nombre": "Bases"}])
@@ -118,3 +128,30 @@ def test_reporte_termina_con_salto_de_linea(tmp_path: Path) -> None:
     cursos = leer_json_cursos(str(ruta_json))
     reporte = generar_reporte(estudiantes, cursos)
     assert reporte.endswith("\n")
+
+
+def test_vista_reporte_guardado_se_reutiliza_hasta_cambiar(tmp_path: Path) -> None:
+    ruta = tmp_path / "reporte.txt"
+    assert _vista_reporte_guardado(ruta) is None
+
+    ruta.write_text("Ana: Python\n", encoding="utf-8")
+    vista = _vista_reporte_guardado(ruta)
+    assert _vista_reporte_guardado(ruta) is vista
+
+    ruta.write_text("Ana: Python\nJuan: JavaScript\n", encoding="utf-8")
+    assert _vista_reporte_guardado(ruta) is not vista
+
+
+def test_resolucion_vuelve_a_data_si_el_local_desaparece(
+    tmp_path: Path, monkeypatch
+) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    _json_tmp_mapa(data_dir, "c.json", {"DB": "Bases"})
+    local = _json_tmp_mapa(tmp_path, "c.json", {"PY": "Python"})
+    monkeypatch.setattr(rep, "_DATA_DIR", data_dir)
+    monkeypatch.chdir(tmp_path)
+
+    assert leer_json_cursos("c.json") == {"PY": "Python"}
+    local.unlink()
+    assert leer_json_cursos("c.json") == {"DB": "Bases"}
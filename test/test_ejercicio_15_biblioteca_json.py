@@ -101,3 +101,126 @@ def test_mostrar_libros_no_revienta(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.setattr(bib.console, "print", _fake_print)
     bib.mostrar_libros(biblioteca, "Prueba")
     assert "obj" in capturado
+
+
+def test_buscar_indice_sigue_cambios_externos_de_la_lista(tmp_path: Path) -> None:
+    ruta = tmp_path / "biblioteca.json"
+    biblioteca = [
+        {"libro_id": "A1", "titulo": "Libro A", "prestado_a": None},
+        {"libro_id": "B2", "titulo": "Libro B", "prestado_a": None},
+    ]
+    assert bib.prestar_libro(biblioteca, "b2", "Ana", ruta=ruta)["libro_id"] == "B2"
+
+    # La lista cambia por fuera del módulo: el índice no debe quedar obsoleto.
+    biblioteca.insert(0, {"libro_id": "C3", "titulo": "Libro C", "prestado_a": None})
+    assert bib.prestar_libro(biblioteca, "C3", "Luis", ruta=ruta) is biblioteca[0]
+    assert bib.devolver_libro(biblioteca, "B2", ruta=ruta) is biblioteca[2]
+
+
+def test_buscar_libro_por_subcadena_y_tras_cambios_de_titulos() -> None:
+    biblioteca = [
+        {"libro_id": "1", "titulo": "Python Básico", "prestado_a": None},
+        {"libro_id": "2", "titulo": "Pythonic Code", "prestado_a": None},
+        {"libro_id": "3", "titulo": "Rayuela", "prestado_a": None},
+    ]
+    assert [b["libro_id"] for b in bib.buscar_libro(biblioteca, "THON")] == ["1", "2"]
+    assert [b["libro_id"] for b in bib.buscar_libro(biblioteca, "on b")] == ["1"]
+    assert [b["libro_id"] for b in bib.buscar_libro(biblioteca, "ra")] == ["3"]
+    assert [b["libro_id"] for b in bib.buscar_libro(biblioteca, "ython")] == ["1", "2"]
+
+    biblioteca[2]["titulo"] = "Python Avanzado"
+    biblioteca.append({"libro_id": "4", "titulo": "Jython", "prestado_a": None})
+    assert [b["libro_id"] for b in bib.buscar_libro(biblioteca, "ython")] == [
+        "1",
+        "2",
+        "3",
+        "4",
+    ]
+    assert bib.buscar_libro(biblioteca, "rayuela") == []
+
+
+def test_guardar_reemplaza_el_archivo_sin_dejar_temporales(tmp_path: Path) -> None:
+    ruta = tmp_path / "biblioteca.json"
+    _guardar_tmp(ruta, [{"libro_id": "1", "titulo": "Viejo", "prestado_a": None}])
+    libros = [{"libro_id": "1", "titulo": "Nuevo", "prestado_a": "Ana"}]
+    bib.guardar_biblioteca(libros, ruta=ruta)
+    assert bib.cargar_biblioteca(ruta=ruta) == libros
+    assert [p.name for p in tmp_path.iterdir()] == ["biblioteca.json"]
+
+
+def test_cambios_en_lote_escribe_una_sola_vez(tmp_path: Path, monkeypatch) -> None:
+    ruta = tmp_path / "biblioteca.json"
+    libros = [
+        {"libro_id": "A1", "titulo": "Libro A", "prestado_a": None},
+        {"libro_id": "B2", "titulo": "Libro B", "prestado_a": None},
+    ]
+    _guardar_tmp(ruta, libros)
+    biblioteca = bib.cargar_biblioteca(ruta=ruta)
+    escrituras: list[Path | None] = []
+    guardar_real = bib.guardar_biblioteca
+
+    def _contar(biblioteca_, ruta=None):
+        escrituras.append(ruta)
+        guardar_real(biblioteca_, ruta=ruta)
+
+    monkeypatch.setattr(bib, "guardar_biblioteca", _contar)
+    with bib.cambios_en_lote():
+        bib.prestar_libro(biblioteca, "A1", "Ana", ruta=ruta)
+        bib.prestar_libro(biblioteca, "B2", "Luis", ruta=ruta)
+        bib.devolver_libro(biblioteca, "A1", ruta=ruta)
+        assert bib.cargar_biblioteca(ruta=ruta) == libros
+
+    assert escrituras == [ruta]
+    assert [b["prestado_a"] for b in bib.cargar_biblioteca(ruta=ruta)] == [None, "Luis"]
+
+
+def test_cargar_deja_listo_el_indice_de_ids(tmp_path: Path, monkeypatch) -> None:
+    ruta = tmp_path / "biblioteca.json"
+    _guardar_tmp(
+        ruta,
+        [
+            {"libro_id": "A1", "titulo": "Rayuela", "prestado_a": None},
+            {"libro_id": "", "titulo": "Inválido", "prestado_a": None},
+            {"libro_id": "B2", "titulo": "Ficciones", "prestado_a": None},
+        ],
+    )
+    biblioteca = bib.cargar_biblioteca(ruta=ruta)
+
+    def _sin_reindexar(*_args: Any) -> Any:
+        raise AssertionError("la carga ya debía dejar el índice construido")
+
+    # Los trigramas se construyen recién con la primera búsqueda.
+    assert id(biblioteca) not in bib._cache_trigramas
+    monkeypatch.setattr(bib, "_indexar_ids", _sin_reindexar)
+    assert bib.prestar_libro(biblioteca, "b2", "Ana", ruta=ruta) is biblioteca[1]
+    assert bib.buscar_libro(biblioteca, "ayu") == [biblioteca[0]]
+    assert bib._cache_trigramas[id(biblioteca)][0] is biblioteca
+
+
+def test_normalizacion_de_campos_y_mensajes(tmp_path: Path) -> None:
+    ruta = tmp_path / "biblioteca.json"
+    _guardar_tmp(
+        ruta,
+        [{"libro_id": " A1 ", "titulo": "Cien\tAños  de soledad", "prestado_a": None}],
+    )
+    biblioteca = bib.cargar_biblioteca(ruta=ruta)
+    assert biblioteca[0]["libro_id"] == "A1"
+    assert biblioteca[0]["titulo"] == "Cien Años de soledad"
+
+    with pytest.raises(ValueError, match="nombre del aprendiz"):
+        bib.prestar_libro(biblioteca, "A1", " \n ", ruta=ruta)
+    with pytest.raises(ValueError, match="id del libro"):
+        bib.devolver_libro(biblioteca, "   ", ruta=ruta)
+
+
+def test_guardar_compacto_por_defecto_y_legible_a_pedido(tmp_path: Path) -> None:
+    ruta = tmp_path / "biblioteca.json"
+    libros = [{"libro_id": "1", "titulo": "Rayuela", "prestado_a": None}]
+
+    bib.guardar_biblioteca(libros, ruta=ruta)
+    compacto = ruta.read_text(encoding="utf-8")
+    assert compacto == '[{"libro_id":"1","titulo":"Rayuela","prestado_a":null}]'
+
+    bib.guardar_biblioteca(libros, ruta=ruta, legible=True)
+    assert ruta.read_text(encoding="utf-8") == json.dumps(libros, indent=2)
+    assert bib.cargar_biblioteca(ruta=ruta) == libros
@@ -6,9 +6,13 @@ import pytest
 
 from src.bloque1.ejercicio_1_refactorizacion_calculadora_imc import (
     calcular_imc,
+    calcular_imc_lote,
     interpretar_imc,
 )
 
+# Pruebas puramente en memoria (sin disco ni red): `pytest -m fast`.
+pytestmark = pytest.mark.fast
+
 
 @pytest.mark.parametrize(
     ("peso", "altura", "esperado"),
@@ -33,6 +37,8 @@ def test_calcular_imc(peso: float, altura: float, esperado: float) -> None:
         (-50.0, 1.75),
         (70.0, 0.0),
         (70.0, -1.80),
+        (math.nan, 1.70),
+        (70.0, math.nan),
     ],
 )
 def test_calcular_imc_valores_invalidos(peso: float, altura: float) -> None:
@@ -41,6 +47,31 @@ def test_calcular_imc_valores_invalidos(peso: float, altura: float) -> None:
         calcular_imc(peso, altura)
 
 
+def test_calcular_imc_lote_coincide_con_el_escalar() -> None:
+    """El cálculo por lotes devuelve lo mismo que calcular_imc, en orden."""
+    pesos = [70.0, 80.0, 45.0, 95.0, 120.0]
+    alturas = [1.75, 1.80, 1.60, 1.70, 2.00]
+    esperado = [calcular_imc(p, a) for p, a in zip(pesos, alturas)]
+    assert calcular_imc_lote(pesos, alturas) == esperado
+    assert calcular_imc_lote([], []) == []
+
+
+@pytest.mark.parametrize(
+    ("pesos", "alturas"),
+    [
+        ([70.0, 0.0], [1.75, 1.80]),
+        ([70.0], [-1.75]),
+        ([70.0, 80.0], [1.75]),
+        ([math.nan, -5.0], [1.70, 1.70]),
+        ([70.0, 80.0], [1.75, math.nan]),
+    ],
+)
+def test_calcular_imc_lote_invalidos(pesos: list[float], alturas: list[float]) -> None:
+    """Series con valores no positivos, NaN o de distinto largo dan ValueError."""
+    with pytest.raises(ValueError):
+        calcular_imc_lote(pesos, alturas)
+
+
 @pytest.mark.parametrize(
     ("imc", "esperado"),
     [
@@ -1,57 +1,101 @@
 import pytest
-
-from src.bloque1.ejercicio_2_generador_perfiles import crear_perfil
-
-
-def test_perfil_completo() -> None:
-    resultado = crear_perfil(
-        "Ana", 28, "leer", "programar", twitter="@ana", github="ana28"
-    )
-    esperado = (
-        "Perfil de Usuario\n"
-        "Nombre: Ana\n"
-        "Edad: 28\n"
-        "Hobbies: leer, programar\n"
-        "Redes sociales: github=ana28, twitter=@ana"
-    )
-    assert resultado == esperado
-
-
-def test_perfil_sin_hobbies_ni_redes() -> None:
-    resultado = crear_perfil("Andres", 19)
-    esperado = (
-        "Perfil de Usuario\n"
-        "Nombre: Andres\n"
-        "Edad: 19\n"
-        "Hobbies: Ninguno\n"
-        "Redes sociales: Ninguna"
-    )
-    assert resultado == esperado
-
-
-def test_perfil_solo_hobbies() -> None:
-    resultado = crear_perfil("Lucía", 22, "ajedrez", "running")
-    esperado = (
-        "Perfil de Usuario\n"
-        "Nombre: Lucía\n"
-        "Edad: 22\n"
-        "Hobbies: ajedrez, running\n"
-        "Redes sociales: Ninguna"
-    )
-    assert resultado == esperado
-
-
-def test_perfil_solo_redes() -> None:
+from rich.console import Console
+
+from src.bloque1.ejercicio_2_generador_perfiles import (
+    THEME,
+    _hobbies_validos,
+    _limpiar_hobbies,
+    _limpiar_redes,
+    _panel_resultado,
+    _parse_hobbies,
+    _parse_redes,
+    _redes_validas,
+    crear_perfil,
+)
+
+# Pruebas puramente en memoria (sin disco ni red): `pytest -m fast`.
+pytestmark = pytest.mark.fast
+
+_PERFIL_TMPL = (
+    "Perfil de Usuario\n"
+    "Nombre: {nombre}\n"
+    "Edad: {edad}\n"
+    "Hobbies: {hobbies}\n"
+    "Redes sociales: {redes}"
+)
+
+
+def _perfil(
+    nombre: str, edad: int, hobbies: str = "Ninguno", redes: str = "Ninguna"
+) -> str:
+    return _PERFIL_TMPL.format(nombre=nombre, edad=edad, hobbies=hobbies, redes=redes)
+
+
+_CASOS_PERFIL = [
+    (
+        "completo",
+        ("Ana", 28, "leer", "programar"),
+        {"twitter": "@ana", "github": "ana28"},
+        _perfil("Ana", 28, "leer, programar", "github=ana28, twitter=@ana"),
+    ),
+    ("sin_hobbies_ni_redes", ("Andres", 19), {}, _perfil("Andres", 19)),
+    (
+        "solo_hobbies",
+        ("Lucía", 22, "ajedrez", "running"),
+        {},
+        _perfil("Lucía", 22, "ajedrez, running"),
+    ),
     # Orden de kwargs no está garantizado, por eso se ordenan por clave en la función
-    resultado = crear_perfil("Miguel", 30, instagram="@mike", twitter="@miguel30")
-    esperado = (
-        "Perfil de Usuario\n"
-        "Nombre: Miguel\n"
-        "Edad: 30\n"
-        "Hobbies: Ninguno\n"
-        "Redes sociales: instagram=@mike, twitter=@miguel30"
-    )
-    assert resultado == esperado
+    (
+        "solo_redes",
+        ("Miguel", 30),
+        {"instagram": "@mike", "twitter": "@miguel30"},
+        _perfil("Miguel", 30, redes="instagram=@mike, twitter=@miguel30"),
+    ),
+    ("nombre_recorta_espacios", ("  Ana   María  ", 20), {}, _perfil("Ana María", 20)),
+    (
+        "hobbies_deduplicados_y_filtrados",
+        ("Diego", 26, "leer", " Leer ", "LEER", "música!", "jugar"),
+        {},
+        _perfil("Diego", 26, "leer, jugar"),
+    ),
+    (
+        "hobbies_todos_invalidos_resulta_en_ninguno",
+        ("Eva", 31, "!" * 3, "x" * 31),
+        {},
+        _perfil("Eva", 31),
+    ),
+    # instagram/twitter sin '@' deben normalizarse
+    (
+        "redes_agrega_arroba_y_ordenadas",
+        ("Nora", 29),
+        {"instagram": "nora", "twitter": "norita"},
+        _perfil("Nora", 29, redes="instagram=@nora, twitter=@norita"),
+    ),
+    (
+        "redes_descarta_invalida_y_valor_largo",
+        ("Pablo", 34),
+        {"github": "pablo34", "1canal": "tv", "twitter": "pablo", "otro": "a" * 51},
+        _perfil("Pablo", 34, redes="github=pablo34, twitter=@pablo"),
+    ),
+    ("edad_como_cadena_es_valida", ("Rosa", "25"), {}, _perfil("Rosa", 25)),
+    # 123 se descarta
+    (
+        "hobby_no_string_se_descarta",
+        ("Leo", 40, "leer", 123),
+        {},
+        _perfil("Leo", 40, "leer"),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "args, kwargs, esperado",
+    [caso[1:] for caso in _CASOS_PERFIL],
+    ids=[caso[0] for caso in _CASOS_PERFIL],
+)
+def test_perfil(args: tuple, kwargs: dict[str, str], esperado: str) -> None:
+    assert crear_perfil(*args, **kwargs) == esperado
 
 
 @pytest.mark.parametrize("nombre_invalido", ["", "   ", "\n\t"])
@@ -68,13 +112,7 @@ def test_edad_negativa_levanta_error() -> None:
 @pytest.mark.parametrize("edad", [0, 120])
 def test_edad_limite_valida(edad: int) -> None:
     resultado = crear_perfil("Luis", edad)
-    esperado = (
-        "Perfil de Usuario\n"
-        "Nombre: Luis\n"
-        f"Edad: {edad}\n"
-        "Hobbies: Ninguno\n"
-        "Redes sociales: Ninguna"
-    )
+    esperado = _perfil("Luis", edad)
     assert resultado == esperado
 
 
@@ -89,98 +127,44 @@ def test_nombre_acentos_y_apostrofo(nombre: str) -> None:
     assert f"Nombre: {nombre}" in resultado
 
 
-def test_nombre_recorta_espacios() -> None:
-    resultado = crear_perfil("  Ana   María  ", 20)
-    esperado = (
-        "Perfil de Usuario\n"
-        "Nombre: Ana María\n"
-        "Edad: 20\n"
-        "Hobbies: Ninguno\n"
-        "Redes sociales: Ninguna"
-    )
-    assert resultado == esperado
-
-
 def test_nombre_muy_largo_levanta_error() -> None:
     nombre = "a" * 61
     with pytest.raises(ValueError):
         crear_perfil(nombre, 30)
 
 
-def test_hobbies_deduplicados_y_filtrados() -> None:
-    resultado = crear_perfil("Diego", 26, "leer", " Leer ", "LEER", "música!", "jugar")
-    esperado = (
-        "Perfil de Usuario\n"
-        "Nombre: Diego\n"
-        "Edad: 26\n"
-        "Hobbies: leer, jugar\n"
-        "Redes sociales: Ninguna"
-    )
-    assert resultado == esperado
-
-
-def test_hobbies_todos_invalidos_resulta_en_ninguno() -> None:
-    resultado = crear_perfil("Eva", 31, "!" * 3, "x" * 31)
-    esperado = (
-        "Perfil de Usuario\n"
-        "Nombre: Eva\n"
-        "Edad: 31\n"
-        "Hobbies: Ninguno\n"
-        "Redes sociales: Ninguna"
-    )
-    assert resultado == esperado
-
+def test_nombre_largo_se_rechaza_por_longitud_antes_que_por_caracteres() -> None:
+    with pytest.raises(ValueError, match="entre 2 y 60"):
+        crear_perfil("#" * 1000, 30)
+    with pytest.raises(ValueError, match="solo permite letras"):
+        crear_perfil("Ana\n#", 30)
+    assert "Nombre: Ana Ruiz\n" in crear_perfil("Ana" + " " * 1000 + "Ruiz", 30)
 
-def test_redes_agrega_arroba_y_ordenadas() -> None:
-    # instagram/twitter sin '@' deben normalizarse
-    resultado = crear_perfil("Nora", 29, instagram="nora", twitter="norita")
-    esperado = (
-        "Perfil de Usuario\n"
-        "Nombre: Nora\n"
-        "Edad: 29\n"
-        "Hobbies: Ninguno\n"
-        "Redes sociales: instagram=@nora, twitter=@norita"
-    )
-    assert resultado == esperado
 
+def test_parseo_de_hobbies_y_redes_desde_texto() -> None:
+    assert _parse_hobbies(" leer, ,programar ,") == ["leer", "programar"]
+    assert _parse_hobbies("   ") == []
+    assert _parse_redes("twitter = @ana, sinigual, =x, github=a=b,") == {
+        "twitter": "@ana",
+        "github": "a=b",
+    }
 
-def test_redes_descarta_invalida_y_valor_largo() -> None:
-    valor_largo = "a" * 51
-    resultado = crear_perfil(
-        "Pablo",
-        34,
-        github="pablo34",
-        **{"1canal": "tv", "twitter": "pablo", "otro": valor_largo},
-    )
-    esperado = (
-        "Perfil de Usuario\n"
-        "Nombre: Pablo\n"
-        "Edad: 34\n"
-        "Hobbies: Ninguno\n"
-        "Redes sociales: github=pablo34, twitter=@pablo"
-    )
-    assert resultado == esperado
 
+def test_limpieza_con_y_sin_registro_de_descartados() -> None:
+    hobbies = ["leer", "Leer", "música!", 7, "x" * 31]
+    assert _limpiar_hobbies(hobbies) == (["leer"], ["música!", "7", "x" * 31])
+    assert _hobbies_validos(hobbies) == ["leer"]
 
-def test_edad_como_cadena_es_valida() -> None:
-    resultado = crear_perfil("Rosa", int("25"))
-    esperado = (
-        "Perfil de Usuario\n"
-        "Nombre: Rosa\n"
-        "Edad: 25\n"
-        "Hobbies: Ninguno\n"
-        "Redes sociales: Ninguna"
+    redes = {"Twitter": "ana", "1red": "x", "github": ""}
+    assert _limpiar_redes(redes) == (
+        {"twitter": "@ana"},
+        {"1red": "x", "github": ""},
     )
-    assert resultado == esperado
+    assert _redes_validas(redes) == {"twitter": "@ana"}
 
 
-def test_hobby_no_string_se_descarta() -> None:
-    resultado = crear_perfil("Leo", 40, "leer", 123)  # 123 se descarta
-    esperado = (
-        "Perfil de Usuario\n"
-        "Nombre: Leo\n"
-        "Edad: 40\n"
-        "Hobbies: leer\n"
-        "Redes sociales: Ninguna"
-    )
-    assert resultado == esperado
+def test_panel_resultado_muestra_los_valores_literalmente() -> None:
+    consola = Console(theme=THEME, width=80)
+    with consola.capture() as captura:
+        consola.print(_panel_resultado({"Redes sociales": "github=[bold]ana"}))
+    assert "github=[bold]ana" in captura.get()
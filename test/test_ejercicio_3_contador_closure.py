@@ -1,9 +1,25 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections import Counter
+from collections.abc import Callable, Iterable
+
+import pytest
 
 from src.bloque1.ejercicio_3_contador_closure import crear_contador
 
+# Pruebas puramente en memoria (sin disco ni red): `pytest -m fast`.
+pytestmark = pytest.mark.fast
+
+
+def _conteos_acumulados(nombres: Iterable[str]) -> list[int]:
+    """Devuelve, para cada nombre, cuántas veces ha aparecido hasta ahí."""
+    conteo: Counter[str] = Counter()
+    esperado: list[int] = []
+    for nombre in nombres:
+        conteo[nombre] += 1
+        esperado.append(conteo[nombre])
+    return esperado
+
 
 def test_incrementos_secuenciales() -> None:
     c = crear_contador()
@@ -18,16 +34,10 @@ def test_contadores_independientes() -> None:
     c2 = crear_contador()
 
     operaciones = [("c1", c1), ("c1", c1), ("c2", c2), ("c1", c1), ("c2", c2)]
-    resultados: list[int] = []
-    for _, fn in operaciones:
-        resultados.append(fn())
+    resultados = [fn() for _, fn in operaciones]
 
     # Esperado sin valores mágicos: contar ocurrencias por alias
-    conteo = {"c1": 0, "c2": 0}
-    esperado: list[int] = []
-    for nombre, _ in operaciones:
-        conteo[nombre] += 1
-        esperado.append(conteo[nombre])
+    esperado = _conteos_acumulados(nombre for nombre, _ in operaciones)
 
     assert resultados == esperado
 
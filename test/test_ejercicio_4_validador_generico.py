@@ -1,13 +1,28 @@
 from __future__ import annotations
 
+import re
+from functools import wraps
+
 import pytest
+from rich.panel import Panel
+from rich.table import Table
 
 from src.bloque1.ejercicio_4_validador_generico import (
+    _MAX_FILAS_TABLA,
+    _PATRON_EMAIL,
+    _es_mayor_a_10_entero,
+    _parse_csv_enteros,
+    _parse_csv_texto,
+    _tabla_lista,
     aplicar_validador,
     es_email_valido,
     es_mayor_a_10,
+    mayor_que,
 )
 
+# Pruebas puramente en memoria (sin disco ni red): `pytest -m fast`.
+pytestmark = pytest.mark.fast
+
 
 def test_aplicar_validador_con_emails() -> None:
     correos = [
@@ -27,6 +42,12 @@ def test_aplicar_validador_con_enteros() -> None:
     assert filtrados == [11, 25, 13]
 
 
+def test_aplicar_validador_mayor_a_10_coincide_con_el_predicado() -> None:
+    datos = [4, 11, "12", 10.5, 30.0, True, -20, 10, 99]
+    esperado = [d for d in datos if es_mayor_a_10(d)]
+    assert aplicar_validador(datos, es_mayor_a_10) == esperado == [11, 99]
+
+
 def test_aplicar_validador_tipo_incorrecto() -> None:
     with pytest.raises(TypeError):
         aplicar_validador(("no", "lista"), es_email_valido)  # type: ignore[arg-type]
@@ -43,12 +64,26 @@ def test_aplicar_validador_tipo_incorrecto() -> None:
         ("a@b", False),
         ("", False),
         (" con_espacios@dom.com ", True),
+        ("josé@correo.com", False),
+        ("ana@dominio.cóm", False),
     ],
 )
 def test_es_email_valido(correo: str, esperado: bool) -> None:
     assert es_email_valido(correo) == esperado
 
 
+def test_es_email_valido_usa_el_patron_precompilado(monkeypatch) -> None:
+    assert isinstance(_PATRON_EMAIL, re.Pattern)
+
+    def _prohibido(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("es_email_valido no debe compilar patrones")
+
+    monkeypatch.setattr(re, "compile", _prohibido)
+    monkeypatch.setattr(re, "match", _prohibido)
+    assert es_email_valido("ana@mail.com")
+    assert not es_email_valido("malo")
+
+
 @pytest.mark.parametrize(
     "numero, esperado",
     [
@@ -61,3 +96,65 @@ def test_es_email_valido(correo: str, esperado: bool) -> None:
 )
 def test_es_mayor_a_10(numero: int, esperado: bool) -> None:
     assert es_mayor_a_10(numero) == esperado
+
+
+@pytest.mark.parametrize(
+    "texto, esperado",
+    [
+        ("4, 11 ,9", ([4, 11, 9], [])),
+        (" 4, 11 ,x, ,9,", ([4, 11, 9], ["x"])),
+        ("1.5, -3", ([-3], ["1.5"])),
+        ("   ", ([], [])),
+    ],
+)
+def test_parse_csv_enteros(texto: str, esperado: tuple[list[int], list[str]]) -> None:
+    assert _parse_csv_enteros(texto) == esperado
+
+
+def test_tabla_lista_pasa_a_texto_con_listas_grandes() -> None:
+    pocos = [str(n) for n in range(_MAX_FILAS_TABLA)]
+    tabla = _tabla_lista("Válidos", pocos)
+    assert isinstance(tabla, Table)
+    assert tabla.row_count == _MAX_FILAS_TABLA
+
+    assert isinstance(_tabla_lista("Válidos", [*pocos, "extra"]), Panel)
+
+
+def test_mayor_que_y_bool_se_filtran_en_linea() -> None:
+    datos = [4, 11, "12", 10.5, True, -20, 10, 99, 0]
+    mayor_que_5 = mayor_que(5)
+    esperado = [d for d in datos if mayor_que_5(d)]
+    assert aplicar_validador(datos, mayor_que_5) == esperado == [11, 10, 99]
+    assert aplicar_validador(datos, bool) == [d for d in datos if d]
+
+
+def test_validador_envuelto_con_wraps_no_usa_el_atajo() -> None:
+    @wraps(es_mayor_a_10)
+    def no_mayor(numero: int) -> bool:
+        return not es_mayor_a_10(numero)
+
+    @wraps(_es_mayor_a_10_entero)
+    def hasta_10(numero: int) -> bool:
+        return not _es_mayor_a_10_entero(numero)
+
+    assert aplicar_validador([5, 20], no_mayor) == [5]
+    assert aplicar_validador([5, 20], hasta_10) == [5]
+    mayor_que_7 = mayor_que(7)
+    menor_que_7 = wraps(mayor_que_7)(lambda n: not mayor_que_7(n))
+    assert aplicar_validador([5, 20], menor_que_7) == [5]
+
+
+def test_parse_csv_texto_conserva_espacios_internos() -> None:
+    texto = " ana@mail.com, ,ana @mail.com,\tuser@dominio.com ,"
+    assert _parse_csv_texto(texto) == [
+        "ana@mail.com",
+        "ana @mail.com",
+        "user@dominio.com",
+    ]
+
+
+def test_variante_sin_chequeo_de_tipo_para_enteros() -> None:
+    numeros, _ = _parse_csv_enteros("4, 11, 9, 25, x, 10, 13")
+    assert aplicar_validador(numeros, _es_mayor_a_10_entero) == aplicar_validador(
+        numeros, es_mayor_a_10
+    )
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Iterator
 
 import pytest
 
 from src.bloque1 import ejercicio_5_calculadora_impuestos as mod
 
+# Pruebas puramente en memoria (sin disco ni red): `pytest -m fast`.
+pytestmark = pytest.mark.fast
 
-@pytest.fixture(autouse=True)
-def _restaurar_tasa() -> None:
-    """Restaura la tasa global tras cada prueba."""
+
+@pytest.fixture
+def _restaurar_tasa() -> Iterator[None]:
+    """Restaura la tasa global tras las pruebas que la modifican."""
     tasa_original = mod.TASA_IVA
     yield
     mod.actualizar_tasa_iva(tasa_original)
@@ -22,6 +26,7 @@ def test_calcular_iva_por_defecto() -> None:
     assert iva == pytest.approx(19.0, abs=0.01)
 
 
+@pytest.mark.usefixtures("_restaurar_tasa")
 def test_actualizar_tasa_afecta_calculo() -> None:
     precio_base = 100.0
     _ = mod.calcular_iva(precio_base)  # 19.0 con 0.19
@@ -36,22 +41,23 @@ def test_validaciones() -> None:
     for tasa in (-0.1, 1.5):
         with pytest.raises(ValueError):
             mod.actualizar_tasa_iva(tasa)
+        with pytest.raises(ValueError):
+            mod.calcular_iva(100.0, tasa)
 
 
 def test_redondeo_dos_decimales() -> None:
-    mod.actualizar_tasa_iva(0.19)
     precio_base = 19999.99
-    iva = mod.calcular_iva(precio_base)
+    iva = mod.calcular_iva(precio_base, 0.19)
     esperado = round(precio_base * 0.19, 2)
     assert math.isfinite(iva)
     assert iva == esperado
 
 
-def test_cambio_multiple_de_tasa() -> None:
+def test_tasa_explicita_no_toca_la_global() -> None:
     precio_base = 250.0
-    mod.actualizar_tasa_iva(0.1)
-    iva_1 = mod.calcular_iva(precio_base)  # 25.0
-    mod.actualizar_tasa_iva(0.21)
-    iva_2 = mod.calcular_iva(precio_base)  # 52.5
+    tasa_global = mod.TASA_IVA
+    iva_1 = mod.calcular_iva(precio_base, 0.1)  # 25.0
+    iva_2 = mod.calcular_iva(precio_base, tasa=0.21)  # 52.5
     assert iva_1 == pytest.approx(25.0, abs=0.01)
     assert iva_2 == pytest.approx(52.5, abs=0.01)
+    assert mod.TASA_IVA == tasa_global
@@ -1,23 +1,41 @@
 from __future__ import annotations
 
+from typing import Any
+
 import pytest
 
 from src.bloque2.ejercicio_6_procesamiento_map_lambda import (
     extraer_precios_con_descuento,
 )
 
+# Pruebas puramente en memoria (sin disco ni red): `pytest -m fast`.
+pytestmark = pytest.mark.fast
 
-def test_descuento_10_por_ciento() -> None:
-    productos = [
+
+@pytest.fixture(scope="module")
+def productos_ropa() -> tuple[dict[str, Any], ...]:
+    """Catálogo compartido por el módulo: la función no modifica su entrada."""
+    return (
         {"nombre": "Camisa", "precio": 50000},
         {"nombre": "Pantalón", "precio": 80000},
         {"nombre": "Zapatos", "precio": 120000},
         {"nombre": "Medias", "precio": 9000},
-    ]
-    precios = extraer_precios_con_descuento(productos, 0.10)
+    )
+
+
+def test_descuento_10_por_ciento(productos_ropa: tuple[dict[str, Any], ...]) -> None:
+    precios = extraer_precios_con_descuento(list(productos_ropa), 0.10)
     assert precios == [45000.0, 72000.0, 108000.0, 8100.0]
 
 
+def test_descuento_no_modifica_los_productos(
+    productos_ropa: tuple[dict[str, Any], ...],
+) -> None:
+    copia = [dict(producto) for producto in productos_ropa]
+    extraer_precios_con_descuento(list(productos_ropa), 0.5)
+    assert list(productos_ropa) == copia
+
+
 def test_descuento_personalizado() -> None:
     productos = [
         {"nombre": "A", "precio": 100.0},
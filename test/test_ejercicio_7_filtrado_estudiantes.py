@@ -4,6 +4,9 @@ import pytest
 
 from src.bloque2.ejercicio_7_filtrado_estudiantes import filtrar_aprobados
 
+# Pruebas puramente en memoria (sin disco ni red): `pytest -m fast`.
+pytestmark = pytest.mark.fast
+
 
 def test_ejemplo_por_defecto() -> None:
     estudiantes = [("Ana", 4.5), ("Juan", 2.8), ("Maria", 3.9)]
@@ -23,16 +26,19 @@ def test_incluye_borde() -> None:
     assert aprobados == [("A", 3.0)]
 
 
-def test_validaciones_tipo_y_rango() -> None:
-    with pytest.raises(ValueError):
-        filtrar_aprobados([("A", 3.5)], -0.1)
-    with pytest.raises(ValueError):
-        filtrar_aprobados([("A", 3.5)], 5.1)
-    with pytest.raises(TypeError):
-        filtrar_aprobados("no lista", 3.0)  # type: ignore[arg-type]
-    with pytest.raises(TypeError):
-        filtrar_aprobados([("A",)], 3.0)  # tupla de longitud incorrecta
-    with pytest.raises(TypeError):
-        filtrar_aprobados([(1, 3.0)], 3.0)  # nombre no es str
-    with pytest.raises(TypeError):
-        filtrar_aprobados([("A", "3.0")], 3.0)  # nota no numérica
+@pytest.mark.parametrize(
+    "estudiantes, umbral, excepcion",
+    [
+        pytest.param([("A", 3.5)], -0.1, ValueError, id="umbral_negativo"),
+        pytest.param([("A", 3.5)], 5.1, ValueError, id="umbral_mayor_a_5"),
+        pytest.param("no lista", 3.0, TypeError, id="no_es_lista"),
+        pytest.param([("A",)], 3.0, TypeError, id="tupla_de_longitud_incorrecta"),
+        pytest.param([(1, 3.0)], 3.0, TypeError, id="nombre_no_es_str"),
+        pytest.param([("A", "3.0")], 3.0, TypeError, id="nota_no_numerica"),
+    ],
+)
+def test_validaciones_tipo_y_rango(
+    estudiantes: object, umbral: float, excepcion: type[Exception]
+) -> None:
+    with pytest.raises(excepcion):
+        filtrar_aprobados(estudiantes, umbral)  # type: ignore[arg-type]
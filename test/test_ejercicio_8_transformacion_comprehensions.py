@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import pytest
+
 from src.bloque2.ejercicio_8_transformacion_comprehensions import (
     longitudes_por_palabra,
     palabras_mayusculas_largas,
 )
 
+# Pruebas puramente en memoria (sin disco ni red): `pytest -m fast`.
+pytestmark = pytest.mark.fast
+
 
 def test_lista_palabras_mayusculas_y_longas() -> None:
     texto = "Hola mundo! Programación en Python, pruebas y documentación extensa."
@@ -7,6 +7,9 @@ from src.bloque2.ejercicio_9_sumatoria_reduce import (
     sumatoria_reduce,
 )
 
+# Pruebas puramente en memoria (sin disco ni red): `pytest -m fast`.
+pytestmark = pytest.mark.fast
+
 
 def test_sumatoria_ejemplo() -> None:
     numeros = [1, 2, 3, 4, 5]